@@ -1,6 +1,8 @@
 # src/hv/cli.py
 import inspect
+import sys
 from importlib import import_module
+from typing import Any, Dict, List, Optional
 
 import typer
 
@@ -13,13 +15,32 @@ app = typer.Typer(
 )
 
 
+def _module_path(cmd_config: Dict[str, Any]) -> str:
+    """Get the import path of the module implementing a command."""
+    return f"hv.commands.{cmd_config['file'].replace('.py', '')}"
+
+
+def _sniff_subcommand(
+    commands_config: Dict[str, Any], argv: List[str]
+) -> Optional[str]:
+    """Return the configured command targeted by argv, or None if unknown."""
+    token = next((arg for arg in argv if not arg.startswith("-")), None)
+    if token is None:
+        return None
+
+    for cmd_name, cmd_config in commands_config.items():
+        if token == cmd_name or token in cmd_config.get("alias", []):
+            return cmd_name
+    return None
+
+
 def execute_default_command(command_name: str):
     """Execute the default command for a module with parameters from config."""
-    commands_config = load_config(config_type="command")
+    commands_config = load_config("command")
     cmd_config = commands_config.get(command_name, {})
 
     if "default_command" in cmd_config:
-        module_path = f"hv.commands.{cmd_config['file'].replace('.py', '')}"
+        module_path = _module_path(cmd_config)
         try:
             cmd_module = import_module(module_path)
             default_func = getattr(cmd_module, cmd_config["default_command"])
@@ -59,12 +80,32 @@ def execute_default_command(command_name: str):
             )
 
 
-def register_commands():
-    """Dynamically register commands from configuration."""
-    commands_config = load_config(config_type="command")
+def _make_default_callback(cmd_name: str):
+    """Build a callback running the command's default when no subcommand is given."""
+
+    def callback(ctx: typer.Context):
+        if ctx.invoked_subcommand is None:
+            execute_default_command(cmd_name)
+
+    return callback
+
+
+def register_commands(argv: Optional[List[str]] = None):
+    """Dynamically register commands from configuration.
+
+    Only the module of the invoked subcommand is imported. Every module is
+    loaded when no known subcommand is given (e.g. ``hv --help``), since the
+    root help lists the full command tree.
+    """
+    commands_config = load_config("command")
+    argv = sys.argv[1:] if argv is None else argv
+
+    requested = _sniff_subcommand(commands_config, argv)
+    if requested is not None:
+        commands_config = {requested: commands_config[requested]}
 
     for cmd_name, cmd_config in commands_config.items():
-        module_path = f"hv.commands.{cmd_config['file'].replace('.py', '')}"
+        module_path = _module_path(cmd_config)
         try:
             cmd_module = import_module(module_path)
             main_app = cmd_module.app
@@ -79,11 +120,9 @@ def register_commands():
 
             # Set up callback if default_command is specified
             if "default_command" in cmd_config:
-
-                @main_app.callback(invoke_without_command=True)
-                def callback(ctx: typer.Context, cmd_name=cmd_name):
-                    if ctx.invoked_subcommand is None:
-                        execute_default_command(cmd_name)
+                main_app.callback(invoke_without_command=True)(
+                    _make_default_callback(cmd_name)
+                )
 
         except ImportError as e:
             typer.echo(f"Warning: Could not load command {cmd_name}: {e}")
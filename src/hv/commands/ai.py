@@ -1,11 +1,22 @@
 # typer cmd : hv ai process_and_claude, hv ai print_project, hv ai claude, hv ai dbt
-import fnmatch
 import os
-import platform
-import subprocess
-import webbrowser
+import re
+import shutil
+import sys
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import (
+    BinaryIO,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+)
 
 import typer
 from rich import print
@@ -17,45 +28,155 @@ app = typer.Typer(
     help="AI-related tools and utilities",
 )
 
+_IS_MACOS = sys.platform == "darwin"
+
 
+@lru_cache(maxsize=128)
 def expand_home_path(path: str) -> str:
     """Expand ~ to home directory in path."""
     return os.path.expanduser(path)
 
 
-def should_ignore_file(file_path: str, ignore_patterns: List[str]) -> bool:
-    """Check if file should be ignored based on patterns."""
-    for pattern in ignore_patterns:
-        pattern = expand_home_path(pattern)
-        if fnmatch.fnmatch(file_path, pattern) or fnmatch.fnmatch(
-            os.path.basename(file_path), pattern
-        ):
-            return True
-        parts = Path(file_path).parts
-        for i in range(len(parts)):
-            subpath = str(Path(*parts[0 : i + 1]))
-            if fnmatch.fnmatch(subpath, pattern):
-                return True
-    return False
+def compile_ignore_patterns(ignore_patterns: List[str]) -> Pattern[str]:
+    """Compile ignore patterns into a single regex.
+
+    The regex matches a path when any pattern matches the whole path or one of
+    its leading directories.
+    """
+    import fnmatch
+
+    if not ignore_patterns:
+        return re.compile(r"(?!)")  # Never matches
+
+    translated = (
+        re.sub(r"\\[Zz]$", "", fnmatch.translate(expand_home_path(pattern)))
+        for pattern in ignore_patterns
+    )
+    sep = re.escape(os.sep)
+    return re.compile(f"(?:{'|'.join(translated)})(?={sep}|\\Z)")
+
+
+class IgnoreRules(NamedTuple):
+    """Compiled ignore patterns used while walking a project."""
+
+    path_re: Pattern[str]  # Matched against relative file paths
+    name_re: Pattern[str]  # Matched against file names
+    prune_re: Pattern[str]  # Matched against relative directory paths
+
+
+def compile_ignore_rules(ignore_patterns: List[str]) -> IgnoreRules:
+    """Compile ignore patterns once for a whole project walk."""
+    # A file name never contains a separator, so patterns that do can't match it
+    name_patterns = [p for p in ignore_patterns if os.sep not in p]
+    # A directory can be skipped when it is ignored itself or when a "dir/*"
+    # pattern covers everything inside it
+    prune_patterns = ignore_patterns + [
+        p[:-2] for p in ignore_patterns if p.endswith(f"{os.sep}*")
+    ]
+    return IgnoreRules(
+        path_re=compile_ignore_patterns(ignore_patterns),
+        name_re=compile_ignore_patterns(name_patterns),
+        prune_re=compile_ignore_patterns(prune_patterns),
+    )
+
 
+def should_ignore_file(rel_path: str, file_name: str, rules: IgnoreRules) -> bool:
+    """Check if file should be ignored based on compiled ignore rules."""
+    return bool(rules.path_re.match(rel_path) or rules.name_re.match(file_name))
 
-def is_text_file(file_path: str, text_extensions: List[str]) -> bool:
+
+def iter_project_files(
+    folder: str,
+    text_exts: FrozenSet[str],
+    rules: IgnoreRules,
+    rel_dir: str = "",
+) -> Iterator[Tuple[str, str]]:
+    """Yield (path, relative path) for every non-ignored text file under folder.
+
+    Directories matched by rules.prune_re are not descended into, as every
+    file below them would be ignored anyway.
+    """
+    subdirs = []
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            rel_path = os.path.join(rel_dir, name) if rel_dir else name
+            if entry.is_dir(follow_symlinks=False):
+                if not rules.prune_re.match(rel_path):
+                    subdirs.append((entry.path, rel_path))
+            elif (
+                is_text_file(name, text_exts)
+                and entry.is_file()
+                and not should_ignore_file(rel_path, name, rules)
+            ):
+                yield entry.path, rel_path
+
+    # Files first, then subdirectories, matching os.walk's top-down order
+    for path, rel_path in subdirs:
+        yield from iter_project_files(path, text_exts, rules, rel_path)
+
+
+def get_text_extensions(text_extensions: Iterable[str]) -> FrozenSet[str]:
+    """Normalize configured extensions (e.g. ".py") for is_text_file."""
+    return frozenset(ext.lower() for ext in text_extensions)
+
+
+def is_text_file(file_name: str, text_exts: FrozenSet[str]) -> bool:
     """Check if file is likely a text file based on extension."""
-    return Path(file_path).suffix.lower() in text_extensions
+    # Same rules as Path.suffix: a leading or trailing dot is not a suffix
+    dot = file_name.rfind(".")
+    return 0 < dot < len(file_name) - 1 and file_name[dot:].lower() in text_exts
+
+
+PRIORITY_FILES = ("README.md", "pyproject.toml")
 
 
 def get_priority_files(folder: Path) -> List[Path]:
     """Get README.md and pyproject.toml if they exist."""
-    priority_files = []
-    readme = folder / "README.md"
-    pyproject = folder / "pyproject.toml"
+    return [folder / name for name in PRIORITY_FILES if (folder / name).exists()]
 
-    if readme.exists():
-        priority_files.append(readme)
-    if pyproject.exists():
-        priority_files.append(pyproject)
 
-    return priority_files
+# sendfile(2) only accepts regular file destinations on Linux (sockets on macOS)
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+
+def copy_file_content(src: BinaryIO, out: BinaryIO) -> None:
+    """Copy src to out as raw bytes, in kernel space when possible."""
+    if _USE_SENDFILE:
+        out.flush()
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(out.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError:
+            src.seek(offset)  # e.g. unsupported destination, finish in Python
+    shutil.copyfileobj(src, out, 1 << 20)
+
+
+def write_file_section(out: BinaryIO, file_path: str, rel_path: str) -> None:
+    """Write a file's content to out, preceded by its relative path header."""
+    with open(file_path, "rb") as src:
+        out.write(f"*# {rel_path}*\n".encode("utf-8"))
+        copy_file_content(src, out)
+        out.write(b"\n\n")
+
+
+def open_output(output_file: Path, output_to_cli: bool):
+    """Open the destination that processed files are streamed to."""
+    if output_to_cli:
+        sys.stdout.flush()
+        return nullcontext(sys.stdout.buffer)
+    return open(output_file, "wb", buffering=1 << 20)
 
 
 def process_project(
@@ -68,81 +189,64 @@ def process_project(
     config = load_config("variables")
     ai_config = config.get("ai", {})
 
-    warning_paths = [expand_home_path(p) for p in ai_config.get("warning_paths", [])]
+    # Compare against "dir/" so that /foo/barbaz doesn't match /foo/bar
+    warning_prefixes = tuple(
+        expand_home_path(p).rstrip(os.sep) + os.sep
+        for p in ai_config.get("warning_paths", [])
+    )
     default_ignore_patterns = ai_config.get("ignore_patterns", [])
-    text_extensions = ai_config.get("text_extensions", [])
+    text_exts = get_text_extensions(ai_config.get("text_extensions", []))
 
     all_ignore_patterns = default_ignore_patterns.copy()
     if ignore_patterns:
         all_ignore_patterns.extend(ignore_patterns)
+    ignore_rules = compile_ignore_rules(all_ignore_patterns)
 
     for folder in folders:
         abs_path = str(folder.resolve())
-        for warning_path in warning_paths:
-            warning_path = expand_home_path(warning_path)
-            if abs_path.startswith(warning_path):
-                print(
-                    f"[yellow]Warning: Processing sensitive path: {abs_path}[/yellow]"
-                )
-                if not typer.confirm("Do you want to continue?"):
-                    raise typer.Abort() from None
-
-    output_content = []
-
-    for folder in folders:
-        folder_path = folder.resolve()
-        if not folder_path.exists():
-            print(f"[red]Error: Folder not found: {folder}[/red]")
-            continue
+        if (abs_path + os.sep).startswith(warning_prefixes):
+            print(f"[yellow]Warning: Processing sensitive path: {abs_path}[/yellow]")
+            if not typer.confirm("Do you want to continue?"):
+                raise typer.Abort() from None
 
-        priority_files = get_priority_files(folder_path)
-        for file_path in priority_files:
-            try:
+    try:
+        output = open_output(output_file, output_to_cli)
+    except OSError as e:
+        print(f"[red]Error writing to output file: {e}[/red]")
+        return
+
+    # Never read back the file we are writing to
+    output_path = str(output_file.resolve())
+
+    with output as out:
+        for folder in folders:
+            folder_path = folder.resolve()
+            if not folder_path.exists():
+                print(f"[red]Error: Folder not found: {folder}[/red]")
+                continue
+
+            priority_files = get_priority_files(folder_path)
+            for file_path in priority_files:
                 rel_path = file_path.relative_to(folder_path)
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                file_header = f"*# {rel_path}*"
-                output_content.extend([file_header, content, ""])
-            except Exception as e:
-                print(f"[red]Error reading {rel_path}: {e}[/red]")
-
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                file_path = Path(root) / file
-
-                if file_path in priority_files:
-                    continue
-
                 try:
-                    rel_path = file_path.relative_to(folder_path)
-                except ValueError:
-                    continue
-
-                if should_ignore_file(str(rel_path), all_ignore_patterns):
-                    continue
+                    write_file_section(out, str(file_path), str(rel_path))
+                except Exception as e:
+                    print(f"[red]Error reading {rel_path}: {e}[/red]")
 
-                if not is_text_file(file_path.name, text_extensions):
+            for file_path, rel_path in iter_project_files(
+                str(folder_path), text_exts, ignore_rules
+            ):
+                # Priority files live at the folder root and are already written
+                if rel_path in PRIORITY_FILES or file_path == output_path:
                     continue
 
                 try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    file_header = f"*# {rel_path}*"
-                    output_content.extend([file_header, content, ""])
+                    write_file_section(out, file_path, rel_path)
                 except Exception as e:
                     print(f"[red]Error reading {rel_path}: {e}[/red]")
 
-    final_output = "\n".join(output_content)
-
-    if output_to_cli:
-        print(final_output)
-    else:
-        try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(final_output)
-            print(f"[green]Project content written to: {output_file}[/green]")
-        except Exception as e:
-            print(f"[red]Error writing to output file: {e}[/red]")
+    if not output_to_cli:
+        print(f"[green]Project content written to: {output_file}[/green]")
 
 
 @app.command(name="process_and_claude", help="Process project and open Claude chat")
@@ -217,6 +321,23 @@ def print_project(
     process_project(folders, output_file, output_to_cli, ignore_patterns or [])
 
 
+def build_clipboard_content(input_file: Path, prompt: str, copy_mode: str) -> bytearray:
+    """Assemble the clipboard payload as bytes, without decoding the input file."""
+    content = bytearray()
+    if copy_mode in ("file", "both"):
+        content += f"<document>\n<source>{input_file}</source>\n".encode("utf-8")
+        content += b"<document_content>\n"
+        with open(input_file, "rb") as f:
+            content += f.read()
+        content += b"\n</document_content>\n</document>"
+        if copy_mode == "both":
+            content += f"\n\n{prompt}".encode("utf-8")
+    else:
+        content += prompt.encode("utf-8")
+    content += b"\n\n<userStyle>Normal</userStyle>"
+    return content
+
+
 @app.command(name="claude", help="Open Claude chat with project context")
 @app.command(name="c")
 def claude_chat(
@@ -229,6 +350,9 @@ def claude_chat(
     ),
 ):
     """Open a new Claude chat."""
+    import subprocess
+    import webbrowser
+
     config = load_config("variables")
     ai_config = config.get("ai", {})
 
@@ -236,33 +360,24 @@ def claude_chat(
     prompt = prompt or ai_config.get("default_prompt", "")
 
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
-            file_content = f.read()
-
-        if copy_mode == "prompt":
-            clipboard_content = f"{prompt}\n\n<userStyle>Normal</userStyle>"
-        elif copy_mode == "file":
-            clipboard_content = f"<document>\n<source>{input_file}</source>\n<document_content>\n{file_content}\n</document_content>\n</document>\n\n<userStyle>Normal</userStyle>"
-        elif copy_mode == "both":
-            clipboard_content = f"<document>\n<source>{input_file}</source>\n<document_content>\n{file_content}\n</document_content>\n</document>\n\n{prompt}\n\n<userStyle>Normal</userStyle>"
-        else:
-            clipboard_content = f"{prompt}\n\n<userStyle>Normal</userStyle>"
+        clipboard_content = build_clipboard_content(input_file, prompt, copy_mode)
 
-        if platform.system() == "Darwin":
+        if _IS_MACOS:
             try:
                 process = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE)
-                process.communicate(clipboard_content.encode("utf-8"))
+                process.communicate(clipboard_content)
                 print("[green]Content copied to clipboard[/green]")
             except subprocess.SubprocessError as e:
                 print(f"[red]Error copying to clipboard: {e}[/red]")
                 raise typer.Exit(1) from e
         else:
             print("[yellow]Clipboard functionality only supported on macOS[/yellow]")
-            print(
-                f"[blue]Here's your content to copy manually:[/blue]\n{clipboard_content}"
-            )
+            print("[blue]Here's your content to copy manually:[/blue]")
+            sys.stdout.flush()
+            sys.stdout.buffer.write(clipboard_content + b"\n")
+            sys.stdout.buffer.flush()
 
-        if platform.system() == "Darwin":
+        if _IS_MACOS:
             try:
                 subprocess.run(
                     ["open", "-a", "Brave Browser", "https://claude.ai/chats"]
@@ -287,30 +402,38 @@ def claude_chat(
         raise typer.Exit(1) from e
 
 
+DBT_ESSENTIAL_DIRS = frozenset({"models", "macros", "analyses"})
+DBT_EXCLUDED_DIRS = frozenset({".venv", "target", "dbt_packages"})
+DBT_EXTENSIONS = (".sql", ".yml", ".yaml")
+
+
+def _scan_dbt_dir(folder: str, in_essential_dir: bool, dbt_paths: List[Path]) -> None:
+    """Collect DBT files below folder into dbt_paths."""
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in DBT_EXCLUDED_DIRS:
+                    _scan_dbt_dir(
+                        entry.path,
+                        in_essential_dir or entry.name in DBT_ESSENTIAL_DIRS,
+                        dbt_paths,
+                    )
+            elif in_essential_dir and entry.name.endswith(DBT_EXTENSIONS):
+                if entry.is_file():
+                    dbt_paths.append(Path(entry.path))
+
+
 def get_dbt_files(folder: Path) -> List[Path]:
     """Get essential DBT files, focusing on models, macros, and analyses."""
     dbt_paths = []
-    essential_dirs = ["models", "macros", "analyses"]
-    essential_extensions = [".sql", ".yml", ".yaml"]
-
-    for root, _, files in os.walk(folder):
-        root_path = Path(root)
-        skip = False
-        # Skip dbt_packages directory
-        for exclude_dir in [".venv", "target", "dbt_packages"]:
-            if exclude_dir in str(root_path):
-                # print(f"[yellow]Skipping {exclude_dir}[/yellow]")
-                skip = True
-                break
-        if skip:
-            continue
-        # Only process if we're in a relevant DBT directory
-        if any(d in str(root_path) for d in essential_dirs):
-            for file in files:
-                file_path = root_path / file
-                if file_path.suffix in essential_extensions:
-                    dbt_paths.append(file_path)
-
+    # The folder may itself be (inside) models/, macros/ or analyses/
+    in_essential_dir = not DBT_ESSENTIAL_DIRS.isdisjoint(Path(folder).resolve().parts)
+    _scan_dbt_dir(str(folder), in_essential_dir, dbt_paths)
     return dbt_paths
 
 
@@ -341,37 +464,29 @@ def process_dbt(
     )
     default_prompt = override_prompt or ai_config.get("default_prompt", "")
 
-    output_content = []
+    try:
+        output = open_output(output_file, output_to_cli)
+    except OSError as e:
+        print(f"[red]Error writing to output file: {e}[/red]")
+        raise typer.Exit(1) from e
 
-    for folder in folder_paths:
-        if not folder.exists():
-            print(f"[red]Error: Folder not found: {folder}[/red]")
-            continue
+    with output as out:
+        for folder in folder_paths:
+            if not folder.exists():
+                print(f"[red]Error: Folder not found: {folder}[/red]")
+                continue
 
-        dbt_files = get_dbt_files(folder)
+            dbt_files = get_dbt_files(folder)
 
-        for file_path in sorted(dbt_files):
-            try:
+            for file_path in sorted(dbt_files):
                 rel_path = file_path.relative_to(folder)
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                file_header = f"*# {rel_path}*"
-                output_content.extend([file_header, content, ""])
-            except Exception as e:
-                print(f"[red]Error reading {rel_path}: {e}[/red]")
-
-    final_output = "\n".join(output_content)
+                try:
+                    write_file_section(out, str(file_path), str(rel_path))
+                except Exception as e:
+                    print(f"[red]Error reading {rel_path}: {e}[/red]")
 
-    if output_to_cli:
-        print(final_output)
-    else:
-        try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(final_output)
-            print(f"[green]DBT content written to: {output_file}[/green]")
+    if not output_to_cli:
+        print(f"[green]DBT content written to: {output_file}[/green]")
 
-            # Open Claude if files were processed successfully
-            claude_chat(input_file=output_file, prompt=default_prompt, copy_mode="both")
-        except Exception as e:
-            print(f"[red]Error writing to output file: {e}[/red]")
-            raise typer.Exit(1) from e
+        # Open Claude if files were processed successfully
+        claude_chat(input_file=output_file, prompt=default_prompt, copy_mode="both")
@@ -1,21 +1,43 @@
 # typer cmd : hv asana my-tasks, hv asana all-tasks, hv asana update-status
-from typing import Dict, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List
 
-import requests
 import typer
 from rich import print
-from rich.table import Table
 
-from hv.utils import get_credential, load_config
+from hv.utils import get_credential, load_config, read_cache, write_cache
+
+if TYPE_CHECKING:
+    import requests
 
 app = typer.Typer(name="asana", help="Asana task management operations")
 
 
+@lru_cache(maxsize=1)
 def get_config():
     config = load_config("variables")
     return config.get("asana", {})
 
 
+def get_api_base_url() -> str:
+    return get_config().get("api_base_url", "https://app.asana.com/api/1.0")
+
+
+def get_done_section_name() -> str:
+    return get_config().get("section_mapping", {}).get("d", "Done")
+
+
+@lru_cache(maxsize=1)
+def get_session() -> "requests.Session":
+    """Get a shared HTTP session so connections are kept alive between calls."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    return session
+
+
 def get_headers() -> Dict[str, str]:
     token = get_credential("asana", "token")
     if not token:
@@ -23,8 +45,14 @@ def get_headers() -> Dict[str, str]:
     return {"Authorization": f"Bearer {token}", "Accept": "application/json"}
 
 
+TASK_FIELDS = "name,completed,due_on,assignee.name,assignee.gid,memberships.project.gid,memberships.section.name"
+
+
 def get_tasks(
-    project_gid: str, assignee_gid: str = None, include_done: bool = True
+    project_gid: str,
+    assignee_gid: str = None,
+    include_done: bool = True,
+    include_notes: bool = False,
 ) -> List[Dict]:
     """
     Get tasks from Asana project.
@@ -33,23 +61,36 @@ def get_tasks(
         project_gid: Project ID
         assignee_gid: Optional assignee filter
         include_done: Whether to include tasks in 'Done' section
+        include_notes: Whether to fetch task descriptions
     """
-    config = get_config()
-    api_base_url = config.get("api_base_url", "https://app.asana.com/api/1.0")
+    api_base_url = get_api_base_url()
     headers = get_headers()
+    session = get_session()
     url = f"{api_base_url}/projects/{project_gid}/tasks"
 
+    # The project tasks endpoint can't filter on assignee, that stays client side
     params = {
-        "opt_fields": "name,completed,due_on,assignee.name,assignee.gid,memberships.project.gid,memberships.section.name,notes",
+        "opt_fields": f"{TASK_FIELDS},notes" if include_notes else TASK_FIELDS,
         "completed_since": "now",
+        "limit": 100,
     }
 
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code != 200:
-        print(f"[red]Error: {response.status_code} - {response.text}[/red]")
-        raise typer.Exit(1) from None
+    tasks = []
+    while True:
+        response = session.get(url, headers=headers, params=params)
+        if response.status_code != 200:
+            print(f"[red]Error: {response.status_code} - {response.text}[/red]")
+            raise typer.Exit(1) from None
 
-    tasks = response.json().get("data", [])
+        page = response.json()
+        tasks.extend(page.get("data", []))
+
+        next_page = page.get("next_page")
+        if not next_page:
+            break
+        params["offset"] = next_page["offset"]
+
+    done_section_name = get_done_section_name()
     filtered_tasks = []
     for task in tasks:
         # Skip completed tasks
@@ -62,8 +103,13 @@ def get_tasks(
         ):
             continue
 
+        # Resolve the section once, it is used by the filter and for display
+        task["_section_name"] = get_section_in_project(
+            task.get("memberships", []), project_gid
+        )
+
         # Apply done section filter
-        if not include_done and is_task_in_done_section(task, project_gid):
+        if not include_done and task["_section_name"] == done_section_name:
             continue
 
         filtered_tasks.append(task)
@@ -71,22 +117,6 @@ def get_tasks(
     return filtered_tasks
 
 
-def is_task_in_done_section(task: Dict, project_gid: str) -> bool:
-    """Check if task is in Done section."""
-    config = get_config()
-    section_mapping = config.get("section_mapping", {})
-    done_section_name = section_mapping.get("d", "Done")
-
-    memberships = task.get("memberships", [])
-    for membership in memberships:
-        if (
-            membership.get("project", {}).get("gid") == project_gid
-            and membership.get("section", {}).get("name") == done_section_name
-        ):
-            return True
-    return False
-
-
 @app.command(name="my-tasks")
 def list_my_tasks(
     include_done: bool = typer.Option(
@@ -100,7 +130,7 @@ def list_my_tasks(
 
     try:
         tasks = get_tasks(project_gid, assignee_gid, include_done=include_done)
-        display_tasks(tasks, project_gid, show_assignee=False)
+        display_tasks(tasks, show_assignee=False)
     except Exception as e:
         print(f"[red]Error: {str(e)}[/red]")
         raise typer.Exit(1) from e
@@ -114,14 +144,16 @@ def list_all_tasks():
 
     try:
         tasks = get_tasks(project_gid)
-        display_tasks(tasks, project_gid)
+        display_tasks(tasks)
     except Exception as e:
         print(f"[red]Error: {str(e)}[/red]")
         raise typer.Exit(1) from e
 
 
-def display_tasks(tasks: List[Dict], project_gid: str, show_assignee: bool = True):
+def display_tasks(tasks: List[Dict], show_assignee: bool = True):
     """Display tasks in a formatted table."""
+    from rich.table import Table
+
     if not tasks:
         print("[yellow]No tasks found[/yellow]")
         return
@@ -134,8 +166,7 @@ def display_tasks(tasks: List[Dict], project_gid: str, show_assignee: bool = Tru
         table.add_column("Assignee")
 
     for task in tasks:
-        memberships = task.get("memberships", [])
-        section = get_section_in_project(memberships, project_gid)
+        section = task["_section_name"]
         name = task.get("name", "No name")
         due_date = task.get("due_on", "No due date")
 
@@ -165,6 +196,30 @@ def get_section_in_project(memberships: List[Dict], project_gid: str) -> str:
     return "No section"
 
 
+def _load_sections(
+    project_gid: str,
+    api_base_url: str,
+    headers: Dict[str, str],
+    ttl: int = 3600,
+    use_cache: bool = True,
+) -> Dict[str, str]:
+    """Get project sections as {name: gid}, cached on disk for ttl seconds."""
+    cache_name = f"asana_sections_{project_gid}"
+    sections = read_cache(cache_name, ttl) if use_cache else None
+    if sections is not None:
+        return sections
+
+    sections_url = f"{api_base_url}/projects/{project_gid}/sections"
+    response = get_session().get(sections_url, headers=headers)
+    if response.status_code != 200:
+        print(f"[red]Failed to get sections: {response.text}[/red]")
+        return {}
+
+    sections = {s["name"]: s["gid"] for s in response.json().get("data", [])}
+    write_cache(cache_name, sections)
+    return sections
+
+
 @app.command(name="update-status")
 @app.command(name="update")
 @app.command(name="us")
@@ -178,16 +233,24 @@ def update_task_status(
     project_gid = config.get("default_project_gid")
     assignee_gid = config.get("default_assignee_gid")
     section_mapping = config.get("section_mapping", {})
-    api_base_url = config.get("api_base_url")
+    api_base_url = get_api_base_url()
 
-    tasks = get_tasks(project_gid, assignee_gid, include_done=include_done)
+    tasks = get_tasks(
+        project_gid, assignee_gid, include_done=include_done, include_notes=True
+    )
     headers = get_headers()
+    session = get_session()
 
     print("\n[yellow]Section shortcuts:[/yellow]")
     for shortcut, section in section_mapping.items():
         print(f"{shortcut:<3} - {section}")
     print("n  - No change")
 
+    sections_by_name = (
+        _load_sections(project_gid, api_base_url, headers) if tasks else {}
+    )
+    sections_refreshed = False
+
     for task in tasks:
         name = task.get("name", "Unnamed task")
         description = task.get("notes", "").strip()
@@ -204,32 +267,30 @@ def update_task_status(
                 comment += f"\n{comment_text}"
 
             comment_url = f"{api_base_url}/tasks/{task['gid']}/stories"
-            requests.post(
-                comment_url, headers=headers, json={"data": {"text": comment}}
-            )
+            session.post(comment_url, headers=headers, json={"data": {"text": comment}})
 
         status = typer.prompt("Move to section? (td/p/r/b/d/n)", default="n").lower()
 
         if status != "n" and status in section_mapping:
             section_name = section_mapping[status]
-            project_sections_url = f"{api_base_url}/projects/{project_gid}/sections"
-            sections_response = requests.get(project_sections_url, headers=headers)
+            section_gid = sections_by_name.get(section_name)
+            if not section_gid and not sections_refreshed:
+                # The section may have been created or renamed since it was cached
+                sections_by_name = _load_sections(
+                    project_gid, api_base_url, headers, use_cache=False
+                )
+                sections_refreshed = True
+                section_gid = sections_by_name.get(section_name)
 
-            if sections_response.status_code == 200:
-                sections = sections_response.json().get("data", [])
-                target_section = next(
-                    (s for s in sections if s["name"] == section_name), None
+            if section_gid:
+                move_url = f"{api_base_url}/sections/{section_gid}/addTask"
+                response = session.post(
+                    move_url, headers=headers, json={"data": {"task": task["gid"]}}
                 )
 
-                if target_section:
-                    move_url = (
-                        f"{api_base_url}/sections/{target_section['gid']}/addTask"
-                    )
-                    response = requests.post(
-                        move_url, headers=headers, json={"data": {"task": task["gid"]}}
-                    )
-
-                    if response.status_code == 200:
-                        print(f"[green]Moved task to {section_name}[/green]")
-                    else:
-                        print(f"[red]Failed to move task: {response.text}[/red]")
+                if response.status_code == 200:
+                    print(f"[green]Moved task to {section_name}[/green]")
+                else:
+                    print(f"[red]Failed to move task: {response.text}[/red]")
+            else:
+                print(f"[red]Section not found: {section_name}[/red]")
@@ -2,19 +2,25 @@
 import asyncio
 import json
 import os
-import subprocess
-import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import typer
+import yaml
 from rich import print
 
 from hv.utils import get_credential, load_config
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+
 app = typer.Typer(name="gcloud", help="Google Cloud operations")
 
 
+@lru_cache(maxsize=1)
 def get_config():
     """Get GCloud configuration from variables.yaml."""
     config = load_config("variables")
@@ -23,14 +29,20 @@ def get_config():
 
 def set_gcloud_auth():
     """Set GCloud authentication using credentials file."""
+    # Respect credentials already exported by the shell or a previous call
+    if os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+        return
+
     credentials_file = get_credential("gcloud", "credentials_file")
     if not credentials_file:
-        raise typer.Exit("GCloud credentials file not found in credentials.yaml") from None
-    
+        raise typer.Exit(
+            "GCloud credentials file not found in credentials.yaml"
+        ) from None
+
     # Replace $HOME with actual home path if needed
     if "$HOME" in credentials_file:
         credentials_file = credentials_file.replace("$HOME", os.path.expanduser("~"))
-    
+
     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_file
 
 
@@ -49,80 +61,168 @@ def get_internal_project_id(nro: str) -> str:
     return get_project_id(nro, policy_type)
 
 
-def _fetch_nro_policy_tags(nro: str, location: str) -> tuple[str, Dict, Optional[str]]:
+def get_policy_tag_client():
+    """Create an async Data Catalog policy tag client using application credentials."""
+    from google.cloud import datacatalog_v1
+
+    return datacatalog_v1.PolicyTagManagerAsyncClient()
+
+
+MAX_PAGE_SIZE = 1000  # Data Catalog defaults to 50 items per list page
+
+
+async def _fetch_taxonomy_tags(client, taxonomy, path_prefix: str) -> Dict[str, str]:
+    """Stream one taxonomy's policy tags straight into {tag name: full path}."""
+    taxonomy_id = taxonomy.name.split("/")[-1]
+    tag_prefix = f"{path_prefix}/{taxonomy_id}/policyTags/"
+    tags = {}
+
+    async for tag in await client.list_policy_tags(
+        request={"parent": taxonomy.name, "page_size": MAX_PAGE_SIZE}
+    ):
+        tags[tag.display_name] = tag_prefix + tag.name.split("/")[-1]
+
+    return tags
+
+
+async def _fetch_nro_policy_tags(
+    nro: str, location: str, client
+) -> tuple[str, Dict, Optional[str]]:
     """Fetch policy tags for a single NRO. Returns (nro, policy_tags, error)."""
+    from google.api_core.exceptions import GoogleAPICallError
+
     project_id = get_internal_project_id(nro)
+    clean_project_id = project_id.replace("-dev", "")
+    path_prefix = f"projects/{clean_project_id}/locations/{location}/taxonomies"
+    nro_suffix = f"-{nro}"
 
     try:
-        # Run gcloud command to list taxonomies
-        cmd = [
-            "gcloud", "data-catalog", "taxonomies", "list",
-            f"--project={project_id}",
-            f"--location={location}",
-            "--format=json"
+        taxonomies = [
+            taxonomy
+            async for taxonomy in await client.list_taxonomies(
+                request={
+                    "parent": f"projects/{project_id}/locations/{location}",
+                    "page_size": MAX_PAGE_SIZE,
+                }
+            )
         ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        taxonomies = json.loads(result.stdout)
+        # Fetch the policy tags of every taxonomy concurrently
+        taxonomy_tags = await asyncio.gather(
+            *(
+                _fetch_taxonomy_tags(client, taxonomy, path_prefix)
+                for taxonomy in taxonomies
+            )
+        )
 
         nro_policy_tags = {}
 
-        for taxonomy in taxonomies:
-            taxonomy_display_name = taxonomy.get("displayName", "").lower()
-            taxonomy_display_name = taxonomy_display_name.replace(f"-{nro}", "")
-            taxonomy_id = taxonomy.get("name", "").split("/")[-1]
+        for taxonomy, tags in zip(taxonomies, taxonomy_tags):
+            taxonomy_display_name = taxonomy.display_name.lower()
+            taxonomy_display_name = taxonomy_display_name.replace(nro_suffix, "")
+            nro_policy_tags.setdefault(taxonomy_display_name, {}).update(tags)
 
-            if taxonomy_display_name not in nro_policy_tags:
-                nro_policy_tags[taxonomy_display_name] = {}
+        return (nro, nro_policy_tags, None)
 
-            # Get policy tags within the taxonomy
-            policy_cmd = [
-                "gcloud", "data-catalog", "taxonomies", "policy-tags", "list",
-                f"--taxonomy={taxonomy.get('name', '')}",
-                f"--location={location}",
-                "--format=json"
-            ]
+    except GoogleAPICallError as e:
+        return (nro, {}, f"Error fetching policy tags: {e.message}")
+    except Exception as e:
+        return (nro, {}, f"Error: {str(e)}")
 
-            policy_result = subprocess.run(policy_cmd, capture_output=True, text=True, check=True)
-            policy_tags = json.loads(policy_result.stdout)
 
-            for tag in policy_tags:
-                tag_name = tag.get("displayName", "")
-                tag_id = tag.get("name", "").split("/")[-1]
-                clean_project_id = project_id.replace("-dev", "")
-                full_path = f"projects/{clean_project_id}/locations/{location}/taxonomies/{taxonomy_id}/policyTags/{tag_id}"
-                nro_policy_tags[taxonomy_display_name][tag_name] = full_path
+MAX_CONCURRENT_NROS = 8
 
-        return (nro, nro_policy_tags, None)
 
-    except subprocess.CalledProcessError as e:
-        return (nro, {}, f"Error fetching policy tags: {e.stderr}")
-    except Exception as e:
-        return (nro, {}, f"Error: {str(e)}")
+async def _fetch_all_policy_tags(
+    nros: List[str], location: str, on_result: Callable[[str, Dict], None]
+) -> int:
+    """Fetch policy tags for all NROs concurrently, handing each to on_result in order.
+
+    Returns the number of NROs fetched successfully.
+    """
+    # Bound the NROs in flight to stay clear of Data Catalog API quotas
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_NROS)
+
+    # Results arrive as they complete but are emitted in NRO order
+    completed = {}
+    next_index = 0
+    fetched = 0
+
+    # A single client (and its channel) is shared by all NROs, and closed after
+    async with get_policy_tag_client() as client:
+
+        async def fetch(index: int, nro: str) -> tuple[int, str, Dict, Optional[str]]:
+            async with semaphore:
+                return (index, *await _fetch_nro_policy_tags(nro, location, client))
 
+        for future in asyncio.as_completed(
+            [fetch(i, nro) for i, nro in enumerate(nros)]
+        ):
+            index, nro, tags, error = await future
+            if error:
+                print(f"[red]{error} for {nro}[/red]")
+            else:
+                print(f"[green]Fetched policy tags for {nro}[/green]")
+            completed[index] = (nro, tags, error)
 
-async def _fetch_all_policy_tags(nros: List[str], location: str) -> Dict:
-    """Fetch policy tags for all NROs concurrently."""
-    loop = asyncio.get_event_loop()
+            while next_index in completed:
+                nro, tags, error = completed.pop(next_index)
+                next_index += 1
+                if not error:
+                    on_result(nro, tags)
+                    fetched += 1
 
-    tasks = [
-        loop.run_in_executor(None, _fetch_nro_policy_tags, nro, location)
-        for nro in nros
-    ]
-    results = await asyncio.gather(*tasks)
+    return fetched
 
-    all_policy_tags = {}
-    for nro, tags, error in results:
-        if error:
-            print(f"[red]{error} for {nro}[/red]")
-        else:
-            print(f"[green]Fetched policy tags for {nro}[/green]")
-            all_policy_tags[nro] = tags
 
-    return all_policy_tags
+OUTPUT_HEADERS = {
+    "json": "Policy Tag IDs in JSON format:",
+    "yaml": "Policy Tag IDs in YAML format:",
+    "raw": "Raw Policy Tag IDs:",
+    "dbt": "Policy Tag IDs in DBT format:",
+}
 
 
-@app.command(name="policy_id", help="List all policy tags with full paths for specified NROs")
+def _to_dbt_keys(taxonomies: Dict) -> Dict[str, str]:
+    """Flatten an NRO's taxonomies into DBT lookup keys."""
+    dbt_keys = {}
+    for taxonomy_name, tags in taxonomies.items():
+        for tag_name, tag_path in tags.items():
+            # Create a flat key for easy lookup in DBT
+            key = f"{taxonomy_name}_{tag_name}".lower().replace("-", "_")
+            dbt_keys[key] = tag_path
+    return dbt_keys
+
+
+def format_nro_policy_tags(
+    output_format: str, nro: str, taxonomies: Dict, first: bool
+) -> str:
+    """Serialize one NRO's entry so that consecutive entries form the full document."""
+    if output_format == "json":
+        body = json.dumps(taxonomies, indent=4).replace("\n", "\n    ")
+        return f"{'{' if first else ','}\n    {json.dumps(nro)}: {body}"
+    if output_format == "raw":
+        return f"{'{' if first else ', '}{nro!r}: {taxonomies!r}"
+    if output_format == "dbt":
+        # DBT-compatible format: nested YAML structure for schema.yml
+        taxonomies = _to_dbt_keys(taxonomies)
+    return yaml.dump(
+        {nro: taxonomies},
+        Dumper=YamlDumper,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+
+
+def format_policy_tags_end(output_format: str, empty: bool) -> str:
+    """Close the document opened by format_nro_policy_tags."""
+    if empty:
+        return "{}" if output_format in ("json", "raw") else "{}\n"
+    return {"json": "\n}", "raw": "}"}.get(output_format, "")
+
+
+@app.command(
+    name="policy_id", help="List all policy tags with full paths for specified NROs"
+)
 @app.command(name="policy_tags")
 def policy_id(
     nro: List[str] = typer.Option(
@@ -137,6 +237,9 @@ def policy_id(
     output_file: Optional[str] = typer.Option(
         None, "--output", "-o", help="Save output to a file"
     ),
+    quiet: bool = typer.Option(
+        False, "--quiet", "-q", help="Don't print the output when saving to a file"
+    ),
 ):
     """Get policy tag IDs from GCloud BigQuery for specified NROs."""
     variables_config = load_config("variables")
@@ -153,53 +256,56 @@ def policy_id(
     # Set authentication
     set_gcloud_auth()
 
-    print(f"[blue]Fetching policy tags for {len(nros_to_process)} NROs...[/blue]")
-    all_policy_tags = asyncio.run(_fetch_all_policy_tags(nros_to_process, location))
-
-    # Output the results
-    output_content = None
-
-    if output_format == "json":
-        output_content = json.dumps(all_policy_tags, indent=4)
-        print("\n[green]Policy Tag IDs in JSON format:[/green]")
-        print(output_content)
-
-    elif output_format == "yaml":
-        output_content = yaml.dump(all_policy_tags, default_flow_style=False, sort_keys=False)
-        print("\n[green]Policy Tag IDs in YAML format:[/green]")
-        print(output_content)
-
-    elif output_format == "raw":
-        output_content = str(all_policy_tags)
-        print("\n[green]Raw Policy Tag IDs:[/green]")
-        print(output_content)
+    # Repeated --nro values are fetched and written once
+    nros_to_process = list(dict.fromkeys(nros_to_process))
+    known_format = output_format in OUTPUT_HEADERS
 
-    elif output_format == "dbt":
-        # DBT-compatible format: nested YAML structure for schema.yml
-        dbt_structure = {}
-        for nro, taxonomies in all_policy_tags.items():
-            dbt_structure[nro] = {}
-            for taxonomy_name, tags in taxonomies.items():
-                for tag_name, tag_path in tags.items():
-                    # Create a flat key for easy lookup in DBT
-                    key = f"{taxonomy_name}_{tag_name}".lower().replace("-", "_")
-                    dbt_structure[nro][key] = tag_path
-        output_content = yaml.dump(dbt_structure, default_flow_style=False, sort_keys=False)
-        print("\n[green]Policy Tag IDs in DBT format:[/green]")
-        print(output_content)
-
-    # Save to file if output_file is specified
-    if output_file and output_content:
+    # Open the output file up front so each NRO is written as soon as it is ready
+    out_file = None
+    if output_file and known_format:
         try:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_file, 'w') as f:
-                f.write(output_content)
-            print(f"\n[green]Output saved to: {output_file}[/green]")
+            out_file = open(output_path, "w")
         except Exception as e:
             print(f"\n[red]Error saving to file: {str(e)}[/red]")
 
+    # The body is only kept in memory when it is printed afterwards
+    print_body = known_format and not (quiet and out_file)
+    chunks = []
+    entries = 0
+
+    def write_chunk(chunk: str):
+        if print_body:
+            chunks.append(chunk)
+        if out_file:
+            out_file.write(chunk)
+
+    def write_nro(nro: str, taxonomies: Dict):
+        nonlocal entries
+        if known_format:
+            write_chunk(
+                format_nro_policy_tags(output_format, nro, taxonomies, entries == 0)
+            )
+            entries += 1
+
+    print(f"[blue]Fetching policy tags for {len(nros_to_process)} NROs...[/blue]")
+    try:
+        asyncio.run(_fetch_all_policy_tags(nros_to_process, location, write_nro))
+        if known_format:
+            write_chunk(format_policy_tags_end(output_format, entries == 0))
+    finally:
+        if out_file:
+            out_file.close()
+
+    # Output the results; the body goes out as plain text, bypassing rich markup
+    if print_body:
+        print(f"\n[green]{OUTPUT_HEADERS[output_format]}[/green]")
+        typer.echo("".join(chunks))
+
+    if out_file:
+        print(f"\n[green]Output saved to: {output_file}[/green]")
+
 
 @app.command(name="projects", help="List GCloud projects for a specified NRO")
 def list_projects(
@@ -211,13 +317,13 @@ def list_projects(
     variables_config = load_config("variables")
     default_nros = variables_config.get("gitlab", {}).get("default_nros", [])
     default_types = variables_config.get("gitlab", {}).get("default_types", [])
-    
+
     # Use provided NROs or default from config
     nros_to_process = nro if nro else default_nros
-    
+
     # Set authentication
     set_gcloud_auth()
-    
+
     gcloud_config = get_config()
     project_types = gcloud_config.get("project_types")
 
@@ -235,4 +341,4 @@ def list_projects(
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    app()
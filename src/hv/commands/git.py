@@ -1,8 +1,12 @@
 # typer cmd : hv git check-commits (correct wrong commit), hv git reset-history, hv git sync, hv git squash (squash all commits from branch into one)
+import os
 import re
+import shlex
 import subprocess
+import sys
+import tempfile
 from functools import wraps
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import typer
 from rich import print
@@ -42,12 +46,60 @@ def get_branch_commits(base_branch: str = "main") -> List[Tuple[str, str]]:
     ]
 
 
-COMMIT_PATTERNS = [r"^(feat|fix|chore)(\(.*?\))?:\s"]
+_CONV_RE = re.compile(r"^(feat|fix|chore)(\(.*?\))?:\s")
 
 
 def is_conventional_commit(message: str) -> bool:
     """Check if commit message follows conventional commits format."""
-    return any(re.match(pattern, message) for pattern in COMMIT_PATTERNS)
+    return _CONV_RE.match(message) is not None
+
+
+def get_invalid_commits(base_branch: str = "main") -> List[Tuple[str, str]]:
+    """Get branch commits whose subject does not follow conventional commits."""
+    # git log --grep would also match body lines, so filter subjects here
+    return [
+        (commit_hash, message)
+        for commit_hash, message in get_branch_commits(base_branch)
+        if not is_conventional_commit(message)
+    ]
+
+
+# Sequence editor that adds an amend step after each commit to reword
+AMEND_TODO_SCRIPT = """\
+import shlex
+import sys
+
+messages = {messages!r}
+todo_path = sys.argv[1]
+
+with open(todo_path) as f:
+    lines = f.readlines()
+
+with open(todo_path, "w") as f:
+    for line in lines:
+        f.write(line)
+        parts = line.split()
+        if len(parts) < 2 or parts[0] not in ("pick", "p"):
+            continue
+        for hash_, message in messages.items():
+            if hash_.startswith(parts[1]):
+                quoted = shlex.quote(message)
+                f.write(f"exec git commit --amend -m {{quoted}} --no-edit\\n")
+                break
+"""
+
+
+def reword_commits(new_messages: Dict[str, str], upstream: str):
+    """Reword several commits with a single interactive rebase onto upstream."""
+    fd, script_path = tempfile.mkstemp(suffix=".py", prefix="hv-rebase-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(AMEND_TODO_SCRIPT.format(messages=new_messages))
+
+        editor = f"{shlex.quote(sys.executable)} {shlex.quote(script_path)}"
+        run_git(["-c", f"sequence.editor={editor}", "rebase", "-i", upstream])
+    finally:
+        os.unlink(script_path)
 
 
 def confirm_action(prompt: str, default: bool = False) -> bool:
@@ -61,12 +113,7 @@ def check_conventional_commits(
     base_branch: str = typer.Option("main", help="Base branch to compare against"),
 ):
     """Check and fix commits that don't follow conventional commits format."""
-    run_git(["rev-parse", "--abbrev-ref", "HEAD"]).stdout.strip()
-    invalid_commits = [
-        (hash_, msg)
-        for hash_, msg in get_branch_commits(base_branch)
-        if not is_conventional_commit(msg)
-    ]
+    invalid_commits = get_invalid_commits(base_branch)
 
     if not invalid_commits:
         print("[green]All commits follow conventional format[/green]")
@@ -79,27 +126,22 @@ def check_conventional_commits(
     if not confirm_action("\nWould you like to fix these commits?"):
         return
 
+    new_messages = {}
     for hash_, message in invalid_commits:
-        new_message = (
-            f"fix: {message.strip()}"
-            if not is_conventional_commit(message)
-            else message
-        )
+        new_message = f"fix: {message.strip()}"
 
         if confirm_action(f"\nAmend commit {hash_[:8]} with message: {new_message}?"):
             print(f"[blue]Current: {message}\nNew: {new_message}[/blue]")
-            run_git(
-                [
-                    "-c",
-                    "sequence.editor=:",
-                    "rebase",
-                    "-i",
-                    "--exec",
-                    f'git commit --amend -m "{new_message}" --no-edit',
-                    f"{hash_}^",
-                ]
-            )
-            print(f"[green]Successfully amended commit {hash_[:8]}[/green]")
+            new_messages[hash_] = new_message
+
+    if not new_messages:
+        return
+
+    # Commits are listed oldest first, so one rebase from the first covers all
+    oldest_hash = next(hash_ for hash_, _ in invalid_commits if hash_ in new_messages)
+    reword_commits(new_messages, f"{oldest_hash}^")
+    for hash_ in new_messages:
+        print(f"[green]Successfully amended commit {hash_[:8]}[/green]")
 
 
 @app.command(
@@ -1,24 +1,58 @@
 # typer cmd : hv gitlab renovate, hv gitlab reviews
 import asyncio
+from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
 from urllib.parse import quote
 
-import requests
 import typer
 from rich import print
 
-from hv.utils import get_credential, load_config
+from hv.utils import (
+    delete_cache,
+    get_credential,
+    load_config,
+    read_cache,
+    write_cache,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
 
 app = typer.Typer(name="gitlab", help="GitLab operations")
 
 
+@lru_cache(maxsize=1)
 def get_config():
     """Get GitLab configuration from variables.yaml."""
     config = load_config("variables")
     return config.get("gitlab", {})
 
 
+@asynccontextmanager
+async def open_session() -> AsyncIterator["aiohttp.ClientSession"]:
+    """Open a pooled, authenticated GitLab session for one event loop run."""
+    import aiohttp
+
+    token = get_credential("gitlab", "token")
+    if not token:
+        raise typer.Exit("GitLab token not found in credentials.yaml") from None
+
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=20)
+    timeout = aiohttp.ClientTimeout(total=30, connect=10)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, headers={"PRIVATE-TOKEN": token}
+    ) as session:
+        yield session
+
+
+async def read_json(response: "aiohttp.ClientResponse"):
+    """Decode a GitLab JSON response body with orjson."""
+    import orjson
+
+    return orjson.loads(await response.read())
+
+
 def get_project_paths(
     nros: List[str] = None, types: List[str] = None, base_path: str = None
 ) -> List[str]:
@@ -27,243 +61,533 @@ def get_project_paths(
     nros = nros or config.get("default_nros", [])
     types = types or config.get("default_types", [])
     base_path = base_path or config.get("default_base_path", "")
-    template = config.get("project_name_template")
+    format_name = config.get("project_name_template").format
 
     return [
-        f"{base_path}/{nro}/{template.format(nro=nro, type=type_)}"
+        f"{base_path}/{nro}/{format_name(nro=nro, type=type_)}"
         for nro in nros
         for type_ in types
     ]
 
 
-@lru_cache(
-    maxsize=None
-)  # None means unlimited cache size since project IDs rarely change
-def get_project_id(project_path: str) -> Optional[int]:
+PROJECT_IDS_CACHE = "gitlab_project_ids"
+
+
+@lru_cache(maxsize=1)
+def get_project_id_cache() -> Dict[str, int]:
+    """Get the project ID cache, loaded from disk once per process."""
+    # Project IDs never change, so entries live until `hv gitlab cache --clear`
+    return read_cache(PROJECT_IDS_CACHE) or {}
+
+
+def save_project_id_cache():
+    """Persist the project ID cache for the next CLI invocation."""
+    write_cache(PROJECT_IDS_CACHE, get_project_id_cache())
+
+
+async def get_project_id(
+    session: "aiohttp.ClientSession", project_path: str
+) -> Optional[int]:
     """Get project ID from project path."""
+    cache = get_project_id_cache()
+    if project_path in cache:
+        return cache[project_path]
+
     config = get_config()
     gitlab_url = config.get("default_gitlab_url")
-    token = get_credential("gitlab", "token")
-    if not token:
-        raise typer.Exit("GitLab token not found in credentials.yaml") from None
-
-    headers = {"PRIVATE-TOKEN": token}
     encoded_path = quote(project_path, safe="")
     url = f"{gitlab_url}/api/v4/projects/{encoded_path}"
 
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        return response.json()["id"]
-    return None
+    async with session.get(url) as response:
+        if response.status != 200:
+            return None
+        project_id = (await read_json(response))["id"]
+
+    cache[project_path] = project_id
+    return project_id
+
+
+RENOVATE_MRS_QUERY = """
+query($paths: [String!], $author: String, $reviewer: String, $withReviews: Boolean!) {
+  projects(membership: false, fullPaths: $paths) {
+    nodes {
+      id
+      fullPath
+      mergeRequests(state: opened, authorUsername: $author, first: 100) {
+        pageInfo { hasNextPage }
+        nodes { iid title webUrl sourceBranch }
+      }
+    }
+  }
+  reviewer: user(username: $reviewer) @include(if: $withReviews) {
+    reviewRequestedMergeRequests(state: opened, first: 100) {
+      pageInfo { hasNextPage }
+      nodes { title webUrl sourceBranch reference(full: true) author { name } }
+    }
+  }
+}
+"""
+GRAPHQL_MAX_FULL_PATHS = 50  # GitLab caps the fullPaths argument per query
+
+
+async def _fetch_renovate_mrs_batch(
+    session: "aiohttp.ClientSession",
+    gitlab_url: str,
+    paths: List[str],
+    renovate_bot: Optional[str],
+    reviewer: Optional[str] = None,
+) -> tuple[Dict[str, List[Dict]], Optional[List[Dict]]]:
+    """Fetch project IDs and open Renovate MRs for up to 50 projects in one query.
+
+    Returns {project path: MRs} for the projects whose MRs fit in one page, and
+    the MRs awaiting the reviewer's review when a reviewer is given and they fit
+    in one page (None otherwise).
+    """
+    async with session.post(
+        f"{gitlab_url}/api/graphql",
+        json={
+            "query": RENOVATE_MRS_QUERY,
+            "variables": {
+                "paths": paths,
+                "author": renovate_bot,
+                "reviewer": reviewer,
+                "withReviews": reviewer is not None,
+            },
+        },
+    ) as response:
+        if response.status != 200:
+            return {}, None
+        data = await read_json(response)
+
+    project_ids = get_project_id_cache()
+    projects_mrs = {}
+    projects = (data.get("data") or {}).get("projects") or {}
+
+    for node in projects.get("nodes", []):
+        project_path = node["fullPath"]
+        # Global IDs look like gid://gitlab/Project/123
+        project_id = int(node["id"].rsplit("/", 1)[-1])
+        project_ids[project_path] = project_id
+
+        merge_requests = node.get("mergeRequests") or {}
+        if merge_requests.get("pageInfo", {}).get("hasNextPage"):
+            # Leave projects with more MRs than one page to the REST listing
+            continue
+
+        projects_mrs[project_path] = [
+            {
+                "project_id": project_id,
+                "project_path": project_path,
+                "iid": int(mr["iid"]),
+                "title": mr["title"],
+                "web_url": mr["webUrl"],
+                "source_branch": mr["sourceBranch"],
+            }
+            for mr in merge_requests.get("nodes", [])
+            if mr["sourceBranch"].startswith("issue-renovate-")
+        ]
 
+    return projects_mrs, _parse_review_mrs(data)
+
+
+def _is_review_mr(mr: Dict, reviewer_path: str) -> bool:
+    """Check whether an MR is a non-Renovate MR under the reviewer's path."""
+    return (
+        not mr["source_branch"].startswith("issue-renovate-")
+        and reviewer_path in mr["references"]["full"]
+    )
+
+
+def _parse_review_mrs(data: Dict) -> Optional[List[Dict]]:
+    """Extract the MRs to review from a GraphQL response, shaped like REST ones."""
+    reviewer = (data.get("data") or {}).get("reviewer") or {}
+    merge_requests = reviewer.get("reviewRequestedMergeRequests")
+    if not merge_requests or merge_requests["pageInfo"]["hasNextPage"]:
+        return None
+
+    reviewer_path = get_config().get("default_reviewer_path")
+    review_mrs = (
+        {
+            "title": mr["title"],
+            "web_url": mr["webUrl"],
+            "source_branch": mr["sourceBranch"],
+            "references": {"full": mr["reference"]},
+            "author": mr["author"],
+        }
+        for mr in merge_requests["nodes"]
+    )
+    return [mr for mr in review_mrs if _is_review_mr(mr, reviewer_path)]
+
+
+PER_PAGE = 100  # Maximum page size accepted by the GitLab REST API
+
+
+async def _paginate(
+    session: "aiohttp.ClientSession", url: str, params: Dict
+) -> AsyncIterator["aiohttp.ClientResponse"]:
+    """Yield every page of a GitLab list endpoint by following Link: rel=next."""
+    next_url = url
+    params = {**params, "per_page": PER_PAGE}
+
+    while next_url:
+        async with session.get(next_url, params=params) as response:
+            yield response
+            if response.status != 200:
+                return
+            next_link = response.links.get("next")
+
+        # The next link already carries the original query parameters
+        next_url = next_link["url"] if next_link else None
+        params = None
 
-def _fetch_project_mrs(project_path: str, gitlab_url: str, headers: Dict) -> List[Dict]:
-    """Fetch MRs for a single project (sync helper for async execution)."""
-    project_id = get_project_id(project_path)
-    if not project_id:
-        print(f"[yellow]Could not find project: {project_path}[/yellow]")
-        return []
 
-    mrs_url = f"{gitlab_url}/api/v4/projects/{project_id}/merge_requests?state=opened"
-    response = requests.get(mrs_url, headers=headers)
+_MAX_CONCURRENCY = 16
 
-    if response.status_code == 200:
-        mrs = [
-            mr
-            for mr in response.json()
+
+async def _gather_bounded(coros) -> list:
+    """Run coroutines with at most _MAX_CONCURRENCY in flight, returning errors as results."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+    async def guarded(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(
+        *(guarded(coro) for coro in coros), return_exceptions=True
+    )
+
+
+async def _fetch_project_mrs(
+    session: "aiohttp.ClientSession",
+    project_path: str,
+    gitlab_url: str,
+    project_id: Optional[int] = None,
+    renovate_bot: Optional[str] = None,
+) -> List[Dict]:
+    """Fetch Renovate MRs for a single project, raising if they cannot be listed."""
+    project_id = project_id or await get_project_id(session, project_path)
+    if not project_id:
+        # Raise rather than return [] so the failure is reported and not cached
+        raise RuntimeError("project not found")
+
+    mrs_url = f"{gitlab_url}/api/v4/projects/{project_id}/merge_requests"
+
+    params = {"state": "opened"}
+    if renovate_bot:
+        # Let GitLab drop non-Renovate MRs instead of transferring them
+        params["author_username"] = renovate_bot
+
+    mrs = []
+    async for response in _paginate(session, mrs_url, params):
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+        # Keep only the fields used downstream, as the GraphQL listing does
+        mrs.extend(
+            {
+                "project_id": mr["project_id"],
+                "project_path": project_path,
+                "iid": mr["iid"],
+                "title": mr["title"],
+                "web_url": mr["web_url"],
+                "source_branch": mr["source_branch"],
+            }
+            for mr in await read_json(response)
             if mr["source_branch"].startswith("issue-renovate-")
-        ]
-        for mr in mrs:
-            mr["project_path"] = project_path
-        return mrs
-    else:
-        print(f"[red]Failed to get MRs for project: {project_path}[/red]")
-        return []
+        )
 
+    return mrs
 
-async def get_renovate_mrs(project_paths: List[str]) -> List[Dict]:
-    """Fetch all open Merge Requests created by Renovate across specified project paths."""
-    config = get_config()
-    gitlab_url = config.get("default_gitlab_url")
-    token = get_credential("gitlab", "token")
-    if not token:
-        raise typer.Exit("GitLab token not found in credentials.yaml") from None
 
-    headers = {"PRIVATE-TOKEN": token}
-    loop = asyncio.get_event_loop()
+MRS_CACHE_PREFIX = "gitlab_mrs_"
+MRS_CACHE_TTL = 180  # Open MRs change slowly; a few minutes of staleness is fine
+
+
+def _mrs_cache_name(project_path: str) -> str:
+    """Get the cache entry name holding a project's open Renovate MRs."""
+    return MRS_CACHE_PREFIX + quote(project_path, safe="")
 
-    # Fetch all projects concurrently
-    tasks = [
-        loop.run_in_executor(None, _fetch_project_mrs, path, gitlab_url, headers)
-        for path in project_paths
-    ]
-    results = await asyncio.gather(*tasks)
 
-    # Flatten results
+async def _fetch_renovate_mrs(
+    project_paths: List[str], reviewer: Optional[str] = None
+) -> tuple[Dict[str, List[Dict]], Optional[List[Dict]]]:
+    """Fetch Renovate MRs per project path, via GraphQL with a REST fallback.
+
+    When a reviewer is given, the first GraphQL query also fetches their MRs to
+    review, returned second (None when GraphQL could not provide them).
+    """
+    config = get_config()
+    gitlab_url = config.get("default_gitlab_url")
+    renovate_bot = config.get("renovate_bot_username")
+
+    project_ids = get_project_id_cache()
+    cached_count = len(project_ids)
+
+    async with open_session() as session:
+        # One GraphQL query per batch returns both project IDs and MRs
+        batches = await _gather_bounded(
+            _fetch_renovate_mrs_batch(
+                session,
+                gitlab_url,
+                project_paths[start : start + GRAPHQL_MAX_FULL_PATHS],
+                renovate_bot,
+                reviewer if start == 0 else None,
+            )
+            for start in range(0, len(project_paths), GRAPHQL_MAX_FULL_PATHS)
+        )
+        graphql_mrs = {}
+        review_mrs = None
+        for batch in batches:
+            if not isinstance(batch, BaseException):
+                graphql_mrs.update(batch[0])
+                if batch[1] is not None:
+                    review_mrs = batch[1]
+
+        # Projects GraphQL did not fully cover fall back to the REST listing
+        rest_paths = [path for path in project_paths if path not in graphql_mrs]
+        rest_results = await _gather_bounded(
+            _fetch_project_mrs(
+                session, path, gitlab_url, project_ids.get(path), renovate_bot
+            )
+            for path in rest_paths
+        )
+
+    if len(project_ids) != cached_count:
+        save_project_id_cache()
+
+    return {**dict(zip(rest_paths, rest_results)), **graphql_mrs}, review_mrs
+
+
+async def _collect_mrs(
+    project_paths: List[str], use_cache: bool, reviewer: Optional[str] = None
+) -> tuple[List[Dict], Optional[List[Dict]]]:
+    """Collect Renovate MRs from the cache or GitLab, plus MRs to review if asked."""
+    results = {}
+    review_mrs = None
+    if use_cache:
+        for path in project_paths:
+            cached_mrs = read_cache(_mrs_cache_name(path), ttl=MRS_CACHE_TTL)
+            if cached_mrs is not None:
+                results[path] = cached_mrs
+
+    uncached_paths = [path for path in project_paths if path not in results]
+    if uncached_paths:
+        fetched, review_mrs = await _fetch_renovate_mrs(uncached_paths, reviewer)
+        for path, mrs in fetched.items():
+            if not isinstance(mrs, BaseException):
+                write_cache(_mrs_cache_name(path), mrs)
+        results.update(fetched)
+
+    # Flatten results, skipping projects whose fetch failed
     renovate_mrs = []
-    for mrs in results:
+    for project_path in project_paths:
+        mrs = results[project_path]
+        if isinstance(mrs, BaseException):
+            print(f"[red]Failed to get MRs for project: {project_path} ({mrs})[/red]")
+            continue
         renovate_mrs.extend(mrs)
 
+    return renovate_mrs, review_mrs
+
+
+async def get_renovate_mrs(
+    project_paths: List[str], use_cache: bool = True
+) -> List[Dict]:
+    """Fetch all open Merge Requests created by Renovate across specified project paths."""
+    renovate_mrs, _ = await _collect_mrs(project_paths, use_cache)
     return renovate_mrs
 
 
-def get_review_mrs() -> List[Dict]:
+async def get_all_mrs(
+    project_paths: List[str], use_cache: bool = True
+) -> tuple[List[Dict], List[Dict]]:
+    """Fetch Renovate MRs and MRs to review, sharing one GraphQL round-trip."""
+    reviewer = get_config().get("default_reviewer_username")
+    renovate_mrs, review_mrs = await _collect_mrs(project_paths, use_cache, reviewer)
+    if review_mrs is None:
+        # Cached Renovate MRs or an incomplete GraphQL page: use the REST listing
+        review_mrs = await get_review_mrs()
+    return renovate_mrs, review_mrs
+
+
+async def get_review_mrs() -> List[Dict]:
     """Fetch all open Merge Requests where user is a reviewer."""
     config = get_config()
     gitlab_url = config.get("default_gitlab_url")
     default_reviewer_path = config.get("default_reviewer_path")
     reviewer_username = config.get("default_reviewer_username")
-    token = get_credential("gitlab", "token")
+    url = f"{gitlab_url}/api/v4/merge_requests"
+    params = {
+        "scope": "all",
+        "state": "opened",
+        "reviewer_username": reviewer_username,
+    }
+
+    mrs = []
+    async with open_session() as session:
+        async for response in _paginate(session, url, params):
+            if response.status != 200:
+                print(f"[red]Failed to get MRs: {await response.text()}[/red]")
+                return []
+
+            # Filter MRs based on project path and exclude Renovate MRs
+            mrs.extend(
+                mr
+                for mr in await read_json(response)
+                if mr["target_project_id"] and _is_review_mr(mr, default_reviewer_path)
+            )
 
-    if not token:
-        raise typer.Exit("GitLab token not found in credentials.yaml") from None
+    return mrs
 
-    headers = {"PRIVATE-TOKEN": token}
-    url = f"{gitlab_url}/api/v4/merge_requests?scope=all&state=opened&reviewer_username={reviewer_username}"
-
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        print(f"[red]Failed to get MRs: {response.text}[/red]")
-        return []
-
-    # Filter MRs based on project path and exclude Renovate MRs
-    mrs = [
-        mr
-        for mr in response.json()
-        if (
-            mr["target_project_id"]
-            and not mr["source_branch"].startswith("issue-renovate-")
-            and default_reviewer_path in mr["references"]["full"]
-        )
-    ]
 
-    return mrs
+MERGED = "merged"
+MERGE_SCHEDULED = "scheduled"
 
 
-def merge_mr(project_id: int, mr_iid: int, title: str) -> bool:
-    """Merge a specific MR and print result."""
+async def merge_mr(
+    session: "aiohttp.ClientSession", project_id: int, mr_iid: int, title: str
+) -> Optional[str]:
+    """Merge a specific MR, or let GitLab merge it once its pipeline succeeds.
+
+    Returns MERGED or MERGE_SCHEDULED, or None if the merge was refused.
+    """
     config = get_config()
     gitlab_url = config.get("default_gitlab_url")
-    token = get_credential("gitlab", "token")
-    if not token:
-        raise typer.Exit("GitLab token not found in credentials.yaml") from None
-
-    headers = {"PRIVATE-TOKEN": token}
     merge_url = (
         f"{gitlab_url}/api/v4/projects/{project_id}/merge_requests/{mr_iid}/merge"
     )
-
-    response = requests.put(merge_url, headers=headers)
-
-    if response.status_code == 200:
-        print(f"[green]Merged[/green] [{project_id}] {title}")
-        return True
-
-    try:
-        error_msg = response.json().get("message", f"HTTP {response.status_code}")
-    except Exception:
-        error_msg = f"HTTP {response.status_code}"
+    # auto_merge supersedes merge_when_pipeline_succeeds on newer GitLab versions
+    params = {"merge_when_pipeline_succeeds": "true", "auto_merge": "true"}
+
+    async with session.put(merge_url, params=params) as response:
+        if response.status == 200:
+            merged = (await read_json(response)).get("state") == "merged"
+            status = "Merged" if merged else "Merge scheduled"
+            print(f"[green]{status}[/green] [{project_id}] {title}")
+            return MERGED if merged else MERGE_SCHEDULED
+
+        try:
+            data = await read_json(response)
+            error_msg = data.get("message", f"HTTP {response.status}")
+        except Exception:
+            error_msg = f"HTTP {response.status}"
 
     print(f"[red]{error_msg}[/red] [{project_id}] {title}")
-    return False
+    return None
 
 
-def approve_mr_if_not_yet(project_id: int, mr_iid: int) -> bool:
+async def approve_mr_if_not_yet(
+    session: "aiohttp.ClientSession", project_id: int, mr_iid: int
+) -> bool:
     """Approve a specific MR if not already approved by current user."""
     config = get_config()
     gitlab_url = config.get("default_gitlab_url")
-    token = get_credential("gitlab", "token")
-    if not token:
-        raise typer.Exit("GitLab token not found in credentials.yaml") from None
-
-    headers = {"PRIVATE-TOKEN": token}
-
-    # Check current approvals
-    approvals_url = (
-        f"{gitlab_url}/api/v4/projects/{project_id}/merge_requests/{mr_iid}/approvals"
-    )
-    response = requests.get(approvals_url, headers=headers)
-    if response.status_code != 200:
-        return False
-
-    # Check if already approved by current user
-    approvals = response.json()
-    if approvals.get("approved"):
-        return True
-
-    # Approve the MR
     approve_url = (
         f"{gitlab_url}/api/v4/projects/{project_id}/merge_requests/{mr_iid}/approve"
     )
-    response = requests.post(approve_url, headers=headers)
-    return response.status_code == 201
+
+    # Approve directly; GitLab answers 401/409 when the user already approved
+    async with session.post(approve_url) as response:
+        return response.status in (201, 401, 409)
 
 
-async def process_mr(mr: Dict) -> bool:
-    """Process a single MR: approve and merge. Returns success."""
-    loop = asyncio.get_event_loop()
+async def process_mr(session: "aiohttp.ClientSession", mr: Dict) -> Optional[str]:
+    """Process a single MR: approve and merge. Returns the merge outcome."""
     title = mr["title"]
     project_id = mr["project_id"]
     mr_iid = mr["iid"]
 
     # Approve first
-    await loop.run_in_executor(None, approve_mr_if_not_yet, project_id, mr_iid)
+    await approve_mr_if_not_yet(session, project_id, mr_iid)
 
     # Then merge
-    return await loop.run_in_executor(None, merge_mr, project_id, mr_iid, title)
+    return await merge_mr(session, project_id, mr_iid, title)
 
 
-async def process_all_mrs(mrs: List[Dict]) -> tuple[int, int]:
-    """Process all MRs concurrently. Returns (success_count, total)."""
-    tasks = [process_mr(mr) for mr in mrs]
-    results = await asyncio.gather(*tasks)
-    return sum(results), len(mrs)
+async def process_all_mrs(mrs: List[Dict]) -> tuple[int, int, int]:
+    """Process all MRs concurrently. Returns (merged_count, scheduled_count, total)."""
+    async with open_session() as session:
+        results = await _gather_bounded(process_mr(session, mr) for mr in mrs)
+
+    # The processed projects' cached MR lists are now stale
+    for project_path in {mr["project_path"] for mr in mrs}:
+        delete_cache(_mrs_cache_name(project_path))
+
+    merged_count = scheduled_count = 0
+    for mr, result in zip(mrs, results):
+        if isinstance(result, BaseException):
+            print(f"[red]{result!r}[/red] [{mr['project_id']}] {mr['title']}")
+        elif result == MERGED:
+            merged_count += 1
+        elif result == MERGE_SCHEDULED:
+            scheduled_count += 1
+    return merged_count, scheduled_count, len(mrs)
 
 
 def display_mrs(mrs: List[Dict]):
-    """Display MRs in a formatted way, grouped by project."""
+    """Display MRs in a formatted table, grouped by project."""
+    from rich.table import Table
+
     if not mrs:
         print("[yellow]No open Renovate merge requests found[/yellow]")
         return
 
     projects_mrs = {}
     for mr in mrs:
-        project_path = mr["project_path"]
-        if project_path not in projects_mrs:
-            projects_mrs[project_path] = []
-        projects_mrs[project_path].append(mr)
+        projects_mrs.setdefault(mr["project_path"], []).append(mr)
 
-    total_mrs = 0
-    print("\n[blue]Found Renovate Merge Requests:[/blue]")
-    print("=" * 80)
+    table = Table(
+        show_header=True,
+        title="[blue]Found Renovate Merge Requests[/blue]",
+        caption=f"[blue]Total MRs found: {len(mrs)}[/blue]",
+    )
+    table.add_column("#", justify="right")
+    table.add_column("Project", style="green")
+    table.add_column("Title")
+    table.add_column("URL")
 
+    index = 0
     for project_path, project_mrs in projects_mrs.items():
-        print(f"\n[green]Project: {project_path}[/green]")
-        print("-" * 80)
-        for i, mr in enumerate(project_mrs, 1):
-            print(f"{total_mrs + i}. {mr['title']}")
-            print(f"   [link={mr['web_url']}]URL here[/link]")
-        total_mrs += len(project_mrs)
+        for mr in project_mrs:
+            index += 1
+            table.add_row(
+                str(index),
+                project_path,
+                mr["title"],
+                f"[link={mr['web_url']}]URL here[/link]",
+            )
 
-    print(f"\n[blue]Total MRs found: {total_mrs}[/blue]")
+    print(table)
 
 
 def display_review_mrs(mrs: List[Dict]):
-    """Display MRs where user is a reviewer in a formatted way."""
+    """Display MRs where user is a reviewer in a formatted table."""
+    from rich.table import Table
+
     if not mrs:
         print("[yellow]No open merge requests found where you are a reviewer[/yellow]")
         return
 
-    print("\n[blue]Merge Requests to Review:[/blue]")
-    print("=" * 80)
+    table = Table(
+        show_header=True,
+        title="[blue]Merge Requests to Review[/blue]",
+        caption=f"[blue]Total MRs to review: {len(mrs)}[/blue]",
+    )
+    table.add_column("#", justify="right")
+    table.add_column("Project")
+    table.add_column("Title", style="green")
+    table.add_column("Author")
+    table.add_column("URL")
 
     for i, mr in enumerate(mrs, 1):
-        print(f"\n{i}. [green]{mr['title']}[/green]")
-        print(f"   Project: {mr['references']['full']}")
-        print(f"   Author: {mr['author']['name']}")
-        print(f"   [link={mr['web_url']}]URL here[/link]")
+        table.add_row(
+            str(i),
+            mr["references"]["full"],
+            mr["title"],
+            mr["author"]["name"],
+            f"[link={mr['web_url']}]URL here[/link]",
+        )
 
-    print(f"\n[blue]Total MRs to review: {len(mrs)}[/blue]")
+    print(table)
 
 
 @app.command(name="renovate", help="Manage Renovate merge requests")
@@ -283,13 +607,16 @@ def renovate_command(
         "-t",
         help="Project type to process (can be specified multiple times)",
     ),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse MR lists fetched in the last minutes"
+    ),
 ):
     """Manage and merge Renovate merge requests across projects."""
     # config = get_config()
     print("[blue]Load all mr, can take up to a minute[/blue]")
     project_paths = get_project_paths(nro, type)
     # print(project_paths)
-    mrs = asyncio.run(get_renovate_mrs(project_paths))
+    mrs = asyncio.run(get_renovate_mrs(project_paths, use_cache))
 
     display_mrs(mrs)
 
@@ -305,8 +632,11 @@ def renovate_command(
         print("[yellow]Operation cancelled[/yellow]")
         return
 
-    success_count, total = asyncio.run(process_all_mrs(mrs))
-    print(f"\n[blue]Merged {success_count} out of {total} merge requests[/blue]")
+    merged_count, scheduled_count, total = asyncio.run(process_all_mrs(mrs))
+    print(
+        f"\n[blue]Out of {total} merge requests: merged {merged_count}, "
+        f"scheduled {scheduled_count}[/blue]"
+    )
 
 
 @app.command(name="reviews", help="List merge requests where you are a reviewer")
@@ -314,29 +644,57 @@ def renovate_command(
 def list_reviews():
     """List all open merge requests where you are a reviewer."""
     try:
-        mrs = get_review_mrs()
+        mrs = asyncio.run(get_review_mrs())
         display_review_mrs(mrs)
     except Exception as e:
         print(f"[red]Error listing reviews: {str(e)}[/red]")
         raise typer.Exit(1) from e
 
 
+@app.command(name="all", help="List Renovate MRs and merge requests to review")
+def list_all(
+    nro: List[str] = typer.Option(
+        None, "--nro", "-n", help="NRO to process (can be specified multiple times)"
+    ),
+    type: List[str] = typer.Option(
+        None,
+        "--type",
+        "-t",
+        help="Project type to process (can be specified multiple times)",
+    ),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse MR lists fetched in the last minutes"
+    ),
+):
+    """List Renovate MRs and MRs where you are a reviewer in one pass."""
+    try:
+        project_paths = get_project_paths(nro, type)
+        renovate_mrs, review_mrs = asyncio.run(get_all_mrs(project_paths, use_cache))
+        display_mrs(renovate_mrs)
+        display_review_mrs(review_mrs)
+    except Exception as e:
+        print(f"[red]Error listing merge requests: {str(e)}[/red]")
+        raise typer.Exit(1) from e
+
+
 @app.command(name="cache", help="Show cache statistics and manage cache")
 def cache_command(
     clear: bool = typer.Option(
-        False, "--clear", "-c", help="Clear the project ID cache"
+        False, "--clear", "-c", help="Clear the project ID, MR and config caches"
     ),
 ):
     """Show cache statistics or clear the cache."""
     if clear:
-        get_project_id.cache_clear()
+        get_project_id_cache().clear()
+        save_project_id_cache()
+        delete_cache(f"{MRS_CACHE_PREFIX}*")
+        get_config.cache_clear()
+        load_config.cache_clear()
+        get_credential.cache_clear()
         print("[green]Cache cleared successfully[/green]")
 
-    cache_info = get_project_id.cache_info()
     print("\n[blue]Cache Statistics:[/blue]")
-    print(f"Hits: {cache_info.hits}")
-    print(f"Misses: {cache_info.misses}")
-    print(f"Current size: {cache_info.currsize}")
+    print(f"Current size: {len(get_project_id_cache())}")
 
 
 if __name__ == "__main__":
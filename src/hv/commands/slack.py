@@ -1,5 +1,6 @@
 # typer cmd : hv slack msg, hv slack go
 import subprocess
+from functools import lru_cache
 
 import typer
 from rich import print
@@ -19,6 +20,17 @@ def run_script(script: str):
         return False
 
 
+def open_deep_link(url: str):
+    """Open a slack:// deep link in the Slack app."""
+    try:
+        subprocess.run(["open", url])
+        return True
+    except subprocess.SubprocessError as e:
+        print(f"[red]Error: {e}[/red]")
+        return False
+
+
+@lru_cache(maxsize=1)
 def get_config():
     """Get Slack configuration from variables.yaml."""
     return load_config("variables").get("slack", {})
@@ -34,6 +46,8 @@ def message(
 ):
     config = get_config()
     user = user or config.get("default_user")
+    # Deep links only navigate: `open` returns before Slack has switched to the
+    # DM, so typing after one could send the text to the previous conversation
     script = f"""
     tell application "Slack"
         activate
@@ -56,8 +70,16 @@ def message(
 @app.command(name="go", help="Go to channel")
 @app.command(name="g")
 def goto_channel(channel: str = typer.Argument(...)):
-    config = load_config("variables").get("slack", {})
+    config = get_config()
     channel_name = config.get("channels", {}).get(channel, channel)
+    team_id = config.get("team_id")
+    channel_id = (config.get("channel_ids") or {}).get(channel_name)
+
+    if team_id and channel_id:
+        if open_deep_link(f"slack://channel?team={team_id}&id={channel_id}"):
+            print(f"[green]Navigated to #{channel_name}[/green]")
+        return
+
     script = f"""
     tell application "Slack"
         activate
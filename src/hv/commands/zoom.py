@@ -1,7 +1,5 @@
 # typer cmd : hv zoom meeting, hv zoom daily
-import platform
-import subprocess
-import webbrowser
+import sys
 
 import typer
 
@@ -9,6 +7,8 @@ from hv.utils import get_credential, load_config
 
 app = typer.Typer(name="zoom", help="Zoom meeting operations")
 
+_IS_MACOS = sys.platform == "darwin"
+
 
 def get_config():
     """Get Zoom configuration from variables.yaml."""
@@ -16,25 +16,24 @@ def get_config():
     return config.get("zoom", {})
 
 
-def get_meeting_url(meeting_name: str = "daily") -> str:
-    """Get Zoom meeting URL from credentials."""
+def join_meeting(meeting_name: str = "daily"):
+    """Join a Zoom meeting from credentials using native app or browser."""
+    import webbrowser
+
     config = get_config()
     domain = config.get("domain", "zoom.us")
     meeting_data = get_credential("zoom", meeting_name)
     if not meeting_data:
         raise typer.Exit(f"Meeting '{meeting_name}' not found in credentials") from None
-    return f"https://{domain}/j/{meeting_data['id']}?pwd={meeting_data['password']}"
-
 
-def join_meeting(url: str):
-    """Join a Zoom meeting using native app or browser."""
-    if platform.system() == "Darwin":
-        try:
-            subprocess.run(["open", "-a", "zoom.us", url])
-        except subprocess.SubprocessError:
-            webbrowser.open(url)
+    meeting_id = meeting_data["id"]
+    password = meeting_data["password"]
+    if _IS_MACOS:
+        # The zoommtg scheme opens the Zoom app directly, without a browser tab
+        url = f"zoommtg://{domain}/join?confno={meeting_id}&pwd={password}"
     else:
-        webbrowser.open(url)
+        url = f"https://{domain}/j/{meeting_id}?pwd={password}"
+    webbrowser.open(url)
 
 
 @app.command(name="meeting")
@@ -45,12 +44,10 @@ def join_specific_meeting(
     ),
 ):
     """Join a specific Zoom meeting."""
-    url = get_meeting_url(meeting_name)
-    join_meeting(url)
+    join_meeting(meeting_name)
 
 
 @app.command(name="daily")
 def join_daily():
     """Join the daily Zoom meeting."""
-    url = get_meeting_url("daily")
-    join_meeting(url)
+    join_meeting("daily")
@@ -1,19 +1,86 @@
+import json
+import os
+import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import typer
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 
+
+@lru_cache(maxsize=8)  # Config files are static for the life of a CLI invocation
 def load_config(config_type: str = "variables") -> Dict[str, Any]:
     """Load configuration from YAML file."""
     config_path = Path(__file__).parent / "config" / f"{config_type}.yaml"
     if not config_path.exists():
         return {}
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
+@lru_cache(maxsize=None)
 def get_credential(service: str, key: str) -> Optional[str]:
     """Get a specific credential from credentials.yaml."""
     creds = load_config("credentials")
     return creds.get(service, {}).get(key)
+
+
+@lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """Get the directory for caches kept across CLI invocations."""
+    cache_dir = Path(typer.get_app_dir("hv")) / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def read_cache(name: str, ttl: Optional[float] = None) -> Optional[Any]:
+    """Read a JSON cache entry, or None if missing, unreadable or older than ttl."""
+    try:
+        cache_path = get_cache_dir() / f"{name}.json"
+        if ttl is not None and time.time() - cache_path.stat().st_mtime > ttl:
+            return None
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(name: str, data: Any) -> None:
+    """Write a JSON cache entry atomically, ignoring failures."""
+    tmp_path = None
+    try:
+        cache_dir = get_cache_dir()
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump(data, f)
+        os.replace(tmp_path, cache_dir / f"{name}.json")
+    except (OSError, TypeError, ValueError):
+        # Do not leave the temporary file of a failed write behind
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def delete_cache(pattern: str) -> None:
+    """Delete the cache entries whose name matches a glob pattern, ignoring failures."""
+    try:
+        cache_paths = list(get_cache_dir().glob(f"{pattern}.json"))
+    except OSError:
+        return
+
+    for cache_path in cache_paths:
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,178 @@
+import fnmatch
+import os
+from pathlib import Path
+
+import pytest
+
+from hv.commands.ai import (
+    compile_ignore_rules,
+    get_dbt_files,
+    get_text_extensions,
+    iter_project_files,
+)
+
+IGNORE_PATTERNS = [
+    "node_modules",
+    "build/*",
+    "docs/private/*",
+    "*.log",
+    ".git",
+    "secret.txt",
+]
+TEXT_EXTENSIONS = [".py", ".md", ".js", ".txt", ".log"]
+TREE = [
+    "README.md",
+    "main.py",
+    "app.log",
+    "image.png",
+    ".git/config.txt",
+    "build/out.py",
+    "build/sub/deep.py",
+    "docs/public.md",
+    "docs/private/notes.md",
+    "docs/private/sub/more.md",
+    "node_modules/lib/index.js",
+    "pkg/node_modules/dep/index.js",
+    "pkg/src/module.py",
+    "pkg/src/secret.txt",
+    "pkg/build/kept.py",
+]
+
+
+DBT_TREE = [
+    "dbt_project.yml",
+    "models/schema.yml",
+    "models/staging/stg_orders.sql",
+    "models/staging/notes.md",
+    "macros/cents.sql",
+    "analyses/revenue.sql",
+    "seeds/countries.csv",
+    "tests/assert_positive.sql",
+    "target/compiled/models/stg_orders.sql",
+    "dbt_packages/utils/macros/star.sql",
+]
+
+
+def reference_should_ignore(file_path: str, ignore_patterns: list) -> bool:
+    """The per-prefix fnmatch loop the compiled rules replaced."""
+    for pattern in ignore_patterns:
+        pattern = os.path.expanduser(pattern)
+        if fnmatch.fnmatch(file_path, pattern) or fnmatch.fnmatch(
+            os.path.basename(file_path), pattern
+        ):
+            return True
+        parts = Path(file_path).parts
+        for i in range(len(parts)):
+            subpath = str(Path(*parts[0 : i + 1]))
+            if fnmatch.fnmatch(subpath, pattern):
+                return True
+    return False
+
+
+def reference_files(folder: Path, ignore_patterns: list, text_extensions: list):
+    """The os.walk listing the scandir walk replaced."""
+    files = []
+    for root, _, names in os.walk(folder):
+        for name in names:
+            rel_path = str((Path(root) / name).relative_to(folder))
+            if reference_should_ignore(rel_path, ignore_patterns):
+                continue
+            if Path(name).suffix.lower() not in text_extensions:
+                continue
+            files.append(rel_path)
+    return files
+
+
+def reference_dbt_files(folder: Path, project_root: Path):
+    """The os.walk and substring checks the scandir DBT walk replaced."""
+    dbt_paths = []
+    for root, _, names in os.walk(folder):
+        # Relative to the project, so the tmp path itself can't match
+        rel_root = os.path.relpath(root, project_root)
+        if any(d in rel_root for d in [".venv", "target", "dbt_packages"]):
+            continue
+        if any(d in rel_root for d in ["models", "macros", "analyses"]):
+            dbt_paths.extend(
+                Path(root) / name
+                for name in names
+                if Path(name).suffix in [".sql", ".yml", ".yaml"]
+            )
+    return dbt_paths
+
+
+def make_tree(root: Path, rel_paths: list) -> Path:
+    for rel_path in rel_paths:
+        file_path = root / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(rel_path)
+    return root
+
+
+@pytest.fixture
+def project(tmp_path):
+    return make_tree(tmp_path, TREE)
+
+
+@pytest.fixture
+def dbt_project(tmp_path):
+    return make_tree(tmp_path / "dbt", DBT_TREE)
+
+
+@pytest.mark.parametrize(
+    "ignore_patterns",
+    [IGNORE_PATTERNS, [], ["pkg"], ["*/node_modules", "*/src/*", "*.md"]],
+)
+def test_iter_project_files_matches_fnmatch_walk(project, ignore_patterns):
+    rules = compile_ignore_rules(ignore_patterns)
+    text_exts = get_text_extensions(TEXT_EXTENSIONS)
+
+    files = [
+        rel_path for _, rel_path in iter_project_files(str(project), text_exts, rules)
+    ]
+
+    assert files == reference_files(project, ignore_patterns, TEXT_EXTENSIONS)
+
+
+def test_iter_project_files_prunes_ignored_dirs(project, monkeypatch):
+    scanned = []
+    scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(os.path.relpath(path, project))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", recording_scandir)
+    rules = compile_ignore_rules(IGNORE_PATTERNS + ["*/node_modules"])
+    text_exts = get_text_extensions(TEXT_EXTENSIONS)
+
+    files = {
+        rel_path for _, rel_path in iter_project_files(str(project), text_exts, rules)
+    }
+
+    assert files == {
+        "README.md",
+        "main.py",
+        "docs/public.md",
+        "pkg/src/module.py",
+        "pkg/build/kept.py",
+    }
+    # Neither "dir/*" patterns nor nested ignored directories are descended into
+    assert sorted(scanned) == [".", "docs", "pkg", "pkg/build", "pkg/src"]
+
+
+@pytest.mark.parametrize("subdir", ["", "models", "models/staging", "macros"])
+def test_get_dbt_files_matches_os_walk(dbt_project, subdir):
+    folder = dbt_project / subdir
+
+    assert sorted(get_dbt_files(folder)) == sorted(
+        reference_dbt_files(folder, dbt_project)
+    )
+
+
+def test_get_dbt_files_from_essential_dir(dbt_project):
+    files = get_dbt_files(dbt_project / "models")
+
+    assert sorted(path.relative_to(dbt_project).as_posix() for path in files) == [
+        "models/schema.yml",
+        "models/staging/stg_orders.sql",
+    ]
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+import yaml
+
+from hv.commands.gcloud import (
+    YamlDumper,
+    format_nro_policy_tags,
+    format_policy_tags_end,
+)
+
+POLICY_TAGS = {
+    "be": {
+        "pii": {
+            "email": "projects/p-be/locations/eu/taxonomies/1/policyTags/11",
+            "phone-number": "projects/p-be/locations/eu/taxonomies/1/policyTags/12",
+        },
+        "finance": {"iban": "projects/p-be/locations/eu/taxonomies/2/policyTags/21"},
+    },
+    "nl": {},
+    "fr": {
+        "pii": {"l'adresse": "projects/p-fr/locations/eu/taxonomies/3/policyTags/31"}
+    },
+}
+
+
+def render(output_format: str, policy_tags: dict) -> str:
+    """Concatenate the per-NRO chunks as policy_id streams them."""
+    chunks = [
+        format_nro_policy_tags(output_format, nro, taxonomies, first=i == 0)
+        for i, (nro, taxonomies) in enumerate(policy_tags.items())
+    ]
+    chunks.append(format_policy_tags_end(output_format, empty=not policy_tags))
+    return "".join(chunks)
+
+
+def dump_yaml(data: dict) -> str:
+    return yaml.dump(data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+
+
+def to_dbt(policy_tags: dict) -> dict:
+    return {
+        nro: {
+            f"{taxonomy_name}_{tag_name}".lower().replace("-", "_"): tag_path
+            for taxonomy_name, tags in taxonomies.items()
+            for tag_name, tag_path in tags.items()
+        }
+        for nro, taxonomies in policy_tags.items()
+    }
+
+
+CASES = [
+    {},
+    {"be": POLICY_TAGS["be"]},
+    {"nl": {}},
+    POLICY_TAGS,
+]
+
+
+@pytest.mark.parametrize("policy_tags", CASES)
+def test_json_chunks_match_whole_document(policy_tags):
+    assert render("json", policy_tags) == json.dumps(policy_tags, indent=4)
+
+
+@pytest.mark.parametrize("policy_tags", CASES)
+def test_yaml_chunks_match_whole_document(policy_tags):
+    assert render("yaml", policy_tags) == dump_yaml(policy_tags)
+
+
+@pytest.mark.parametrize("policy_tags", CASES)
+def test_raw_chunks_match_whole_document(policy_tags):
+    assert render("raw", policy_tags) == str(policy_tags)
+
+
+@pytest.mark.parametrize("policy_tags", CASES)
+def test_dbt_chunks_match_whole_document(policy_tags):
+    assert render("dbt", policy_tags) == dump_yaml(to_dbt(policy_tags))
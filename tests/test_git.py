@@ -0,0 +1,57 @@
+import subprocess
+
+import pytest
+
+from hv.commands.git import get_invalid_commits, reword_commits
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def commit(repo, file_name: str, message: str) -> str:
+    (repo / file_name).write_text(file_name)
+    git(repo, "add", file_name)
+    git(repo, "commit", "-q", "-m", message)
+    return git(repo, "rev-parse", "HEAD").strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.name", "Test")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    commit(tmp_path, "base.txt", "chore: base")
+    git(tmp_path, "checkout", "-q", "-b", "feature")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_reword_commits_rewrites_quotes_and_dollars(repo):
+    first = commit(repo, "a.txt", "Add a")
+    commit(repo, "b.txt", "fix: keep b")
+    third = commit(repo, "c.txt", "Add c")
+    new_messages = {
+        first: "feat: add 'a' with \"quotes\" and $HOME",
+        third: "fix(c): cost is $5 `not a command` it's $(true)",
+    }
+
+    reword_commits(new_messages, "main")
+
+    subjects = git(repo, "log", "--reverse", "--format=%s", "main..HEAD")
+    assert subjects.splitlines() == [
+        new_messages[first],
+        "fix: keep b",
+        new_messages[third],
+    ]
+    assert git(repo, "ls-files").split() == ["a.txt", "b.txt", "base.txt", "c.txt"]
+    assert get_invalid_commits("main") == []
+
+
+def test_get_invalid_commits_checks_subjects_only(repo):
+    bad = commit(repo, "a.txt", "Subject bad\n\nfix: body line")
+    commit(repo, "b.txt", "feat: good subject\n\nNot conventional body")
+
+    assert get_invalid_commits("main") == [(bad, "Subject bad")]
@@ -0,0 +1,282 @@
+import asyncio
+import os
+import time
+from functools import lru_cache
+from urllib.parse import quote
+
+import pytest
+from aiohttp import web
+from typer.testing import CliRunner
+
+from hv import utils
+from hv.commands import gitlab
+
+
+def renovate_mr(project_id: int, iid: int) -> dict:
+    return {
+        "project_id": project_id,
+        "iid": iid,
+        "title": f"Update dependency {project_id}-{iid}",
+        "web_url": f"https://gitlab.example.com/mr/{project_id}/{iid}",
+        "source_branch": f"issue-renovate-{iid}",
+    }
+
+
+class FakeGitLab:
+    """Minimal GitLab API serving the endpoints the gitlab command uses."""
+
+    def __init__(self):
+        self.config = {"renovate_bot_username": "renovate-bot"}
+        self.calls = []
+        # {path: (project id, MRs, hasNextPage)} answered by GraphQL
+        self.graphql_projects = {}
+        # {path: project id} answered by the REST project lookup
+        self.project_ids = {}
+        # {project id: [page of MRs, ...]} answered by the REST MR listing
+        self.mr_pages = {}
+        self.mr_status = {}
+        # {MR iid: (status, JSON body)} answered by the merge endpoint
+        self.merge_responses = {}
+
+    async def graphql(self, request):
+        body = await request.json()
+        self.calls.append("graphql")
+        nodes = [
+            {
+                "id": f"gid://gitlab/Project/{project_id}",
+                "fullPath": path,
+                "mergeRequests": {
+                    "pageInfo": {"hasNextPage": has_next_page},
+                    "nodes": [
+                        {
+                            "iid": str(mr["iid"]),
+                            "title": mr["title"],
+                            "webUrl": mr["web_url"],
+                            "sourceBranch": mr["source_branch"],
+                        }
+                        for mr in mrs
+                    ],
+                },
+            }
+            for path, (project_id, mrs, has_next_page) in self.graphql_projects.items()
+            if path in body["variables"]["paths"]
+        ]
+        return web.json_response({"data": {"projects": {"nodes": nodes}}})
+
+    async def project(self, request):
+        path = request.match_info["path"]
+        self.calls.append(f"project:{path}")
+        if path not in self.project_ids:
+            return web.json_response({"message": "404 Project Not Found"}, status=404)
+        return web.json_response({"id": self.project_ids[path]})
+
+    async def merge_requests(self, request):
+        project_id = int(request.match_info["id"])
+        page = int(request.query.get("page", "1"))
+        self.calls.append(f"mrs:{project_id}:{page}:{request.query['per_page']}")
+        status = self.mr_status.get(project_id, 200)
+        if status != 200:
+            return web.json_response({"message": "error"}, status=status)
+
+        pages = self.mr_pages[project_id]
+        headers = {}
+        if page < len(pages):
+            next_url = request.url.with_query({**request.query, "page": str(page + 1)})
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return web.json_response(pages[page - 1], headers=headers)
+
+    async def approve(self, request):
+        return web.json_response({}, status=201)
+
+    async def merge(self, request):
+        status, body = self.merge_responses[int(request.match_info["iid"])]
+        return web.json_response(body, status=status)
+
+    def run(self, make_coro):
+        """Serve the fake API while running the coroutine returned by make_coro."""
+
+        async def main():
+            app = web.Application()
+            app.router.add_post("/api/graphql", self.graphql)
+            app.router.add_get(
+                r"/api/v4/projects/{id:\d+}/merge_requests", self.merge_requests
+            )
+            app.router.add_post(
+                "/api/v4/projects/{id}/merge_requests/{iid}/approve", self.approve
+            )
+            app.router.add_put(
+                "/api/v4/projects/{id}/merge_requests/{iid}/merge", self.merge
+            )
+            app.router.add_get("/api/v4/projects/{path}", self.project)
+
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            host, port = runner.addresses[0][:2]
+            self.config["default_gitlab_url"] = f"http://{host}:{port}"
+            try:
+                return await make_coro()
+            finally:
+                await runner.cleanup()
+
+        return asyncio.run(main())
+
+
+@pytest.fixture
+def fake_gitlab(monkeypatch, tmp_path):
+    fake = FakeGitLab()
+    monkeypatch.setattr(
+        gitlab, "load_config", lru_cache()(lambda name: {"gitlab": fake.config})
+    )
+    monkeypatch.setattr(
+        gitlab, "get_credential", lru_cache()(lambda service, key: "token")
+    )
+    monkeypatch.setattr(utils, "get_cache_dir", lambda: tmp_path)
+    gitlab.get_config.cache_clear()
+    gitlab.get_project_id_cache.cache_clear()
+    yield fake
+    gitlab.get_config.cache_clear()
+    gitlab.get_project_id_cache.cache_clear()
+
+
+def mr_cache_path(tmp_path, project_path: str):
+    return tmp_path / f"gitlab_mrs_{quote(project_path, safe='')}.json"
+
+
+def test_graphql_falls_back_to_rest(fake_gitlab):
+    fake_gitlab.graphql_projects = {
+        "grp/a": (
+            1,
+            [renovate_mr(1, 1), {**renovate_mr(1, 2), "source_branch": "x"}],
+            False,
+        ),
+        "grp/c": (3, [renovate_mr(3, 1)], True),
+    }
+    fake_gitlab.project_ids = {"grp/b": 2}
+    fake_gitlab.mr_pages = {
+        2: [[renovate_mr(2, 1)]],
+        3: [[renovate_mr(3, 1), renovate_mr(3, 2)]],
+    }
+
+    mrs = fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a", "grp/b", "grp/c"]))
+
+    assert [(mr["project_path"], mr["project_id"], mr["iid"]) for mr in mrs] == [
+        ("grp/a", 1, 1),
+        ("grp/b", 2, 1),
+        ("grp/c", 3, 1),
+        ("grp/c", 3, 2),
+    ]
+    # grp/c's ID came from GraphQL, so only grp/b needs a project lookup
+    assert sorted(fake_gitlab.calls) == [
+        "graphql",
+        "mrs:2:1:100",
+        "mrs:3:1:100",
+        "project:grp/b",
+    ]
+    assert gitlab.get_project_id_cache() == {"grp/a": 1, "grp/b": 2, "grp/c": 3}
+
+
+def test_rest_listing_follows_next_links(fake_gitlab):
+    fake_gitlab.project_ids = {"grp/a": 1}
+    fake_gitlab.mr_pages = {
+        1: [
+            [renovate_mr(1, 1), {**renovate_mr(1, 2), "source_branch": "main"}],
+            [renovate_mr(1, 3)],
+            [renovate_mr(1, 4)],
+        ]
+    }
+
+    mrs = fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a"]))
+
+    assert [mr["iid"] for mr in mrs] == [1, 3, 4]
+    assert fake_gitlab.calls[-3:] == ["mrs:1:1:100", "mrs:1:2:100", "mrs:1:3:100"]
+    assert set(mrs[0]) == {
+        "project_id",
+        "project_path",
+        "iid",
+        "title",
+        "web_url",
+        "source_branch",
+    }
+
+
+def test_failed_listing_is_reported_and_not_cached(fake_gitlab, tmp_path, capsys):
+    fake_gitlab.project_ids = {"grp/a": 1}
+    fake_gitlab.mr_pages = {1: [[renovate_mr(1, 1)]]}
+    fake_gitlab.mr_status = {1: 500}
+
+    assert fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a", "grp/x"])) == []
+    output = capsys.readouterr().out
+    assert "Failed to get MRs for project: grp/a (HTTP 500)" in output
+    assert "Failed to get MRs for project: grp/x (project not found)" in output
+    assert not mr_cache_path(tmp_path, "grp/a").exists()
+    assert not mr_cache_path(tmp_path, "grp/x").exists()
+
+    fake_gitlab.mr_status = {}
+    mrs = fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a"]))
+    assert [mr["iid"] for mr in mrs] == [1]
+
+
+def test_mr_cache_is_reused_until_ttl_expires(fake_gitlab, tmp_path):
+    fake_gitlab.graphql_projects = {"grp/a": (1, [renovate_mr(1, 1)], False)}
+
+    first = fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a"]))
+    second = fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a"]))
+    assert second == first
+    assert fake_gitlab.calls == ["graphql"]
+
+    fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a"], use_cache=False))
+    assert fake_gitlab.calls == ["graphql", "graphql"]
+
+    expired = time.time() - gitlab.MRS_CACHE_TTL - 1
+    os.utime(mr_cache_path(tmp_path, "grp/a"), (expired, expired))
+    fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a"]))
+    assert fake_gitlab.calls == ["graphql", "graphql", "graphql"]
+
+
+def test_cache_clear_drops_project_ids_and_mr_lists(fake_gitlab, tmp_path):
+    fake_gitlab.graphql_projects = {"grp/a": (1, [renovate_mr(1, 1)], False)}
+    fake_gitlab.run(lambda: gitlab.get_renovate_mrs(["grp/a"]))
+    assert mr_cache_path(tmp_path, "grp/a").exists()
+
+    result = CliRunner().invoke(gitlab.app, ["cache", "--clear"])
+
+    assert result.exit_code == 0
+    assert "Current size: 0" in result.output
+    assert not mr_cache_path(tmp_path, "grp/a").exists()
+    assert utils.read_cache(gitlab.PROJECT_IDS_CACHE) == {}
+
+
+def test_merge_mr_outcomes(fake_gitlab):
+    fake_gitlab.merge_responses = {
+        1: (200, {"state": "merged"}),
+        2: (200, {"state": "opened"}),
+        3: (405, {"message": "Method Not Allowed"}),
+    }
+
+    async def merge_all():
+        async with gitlab.open_session() as session:
+            return [
+                await gitlab.merge_mr(session, 1, iid, "title") for iid in (1, 2, 3)
+            ]
+
+    assert fake_gitlab.run(merge_all) == [
+        gitlab.MERGED,
+        gitlab.MERGE_SCHEDULED,
+        None,
+    ]
+
+
+def test_process_all_mrs_counts_merged_and_scheduled(fake_gitlab, tmp_path):
+    fake_gitlab.merge_responses = {
+        1: (200, {"state": "merged"}),
+        2: (200, {"state": "opened"}),
+        3: (405, {"message": "Method Not Allowed"}),
+    }
+    mrs = [{**renovate_mr(1, iid), "project_path": "grp/a"} for iid in (1, 2, 3)]
+    utils.write_cache(gitlab._mrs_cache_name("grp/a"), mrs)
+
+    assert fake_gitlab.run(lambda: gitlab.process_all_mrs(mrs)) == (1, 1, 3)
+    # The processed project's cached MR list is invalidated
+    assert not mr_cache_path(tmp_path, "grp/a").exists()